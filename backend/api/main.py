@@ -3,90 +3,158 @@ Main FastAPI application for AI-driven yield farming optimization platform.
 Provides REST API endpoints for vault management, strategy optimization, and user interactions.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, status, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
+import orjson
+import asyncio
+import copy
+import hashlib
+import importlib
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import time
+from typing import Dict, List, Any, Awaitable, Callable, Set, Tuple
+from collections import defaultdict
+from datetime import datetime, timezone
 import os
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
 
 # Import our modules
-from .routers import vaults, strategies, users, analytics, automation
 from .dependencies import get_current_user, get_web3_service, get_ml_service
 from ..database.database import engine, Base
 from ..services.web3_service import Web3Service
 from ..services.ml_service import MLService
 from ..services.vault_service import VaultService
 from ..services.user_service import UserService
+from ..services.task_service import collect_training_data, retrain_models, get_task_status
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global services
-web3_service: Optional[Web3Service] = None
-ml_service: Optional[MLService] = None
-vault_service: Optional[VaultService] = None
-user_service: Optional[UserService] = None
+class JSONLogFormatter(logging.Formatter):
+    """Render log records as single-line JSON"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return orjson.dumps(payload).decode()
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager"""
-    # Startup
-    logger.info("Starting AI Yield Farming API...")
+class TracebackQueueHandler(QueueHandler):
+    """Queue records with the traceback kept apart from the message"""
     
-    # Initialize database
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database initialized")
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() folds the traceback into msg and drops exc_info;
+        # render it into exc_text instead so the formatter can emit it separately
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+def _start_log_listener() -> Callable[[], None]:
+    """Route root logging through a queue so the event loop never blocks on stderr"""
     
-    # Initialize services
-    global web3_service, ml_service, vault_service, user_service
+    log_queue = queue.Queue(-1)
     
-    try:
-        # Web3 service
-        web3_service = Web3Service(
-            provider_url=os.getenv('INFURA_API_KEY', 'http://localhost:8545'),
-            private_key=os.getenv('PRIVATE_KEY')
-        )
-        await web3_service.initialize()
-        logger.info("Web3 service initialized")
-        
-        # ML service
-        ml_service = MLService()
-        await ml_service.initialize()
-        logger.info("ML service initialized")
-        
-        # Vault service
-        vault_service = VaultService(web3_service, ml_service)
-        logger.info("Vault service initialized")
-        
-        # User service
-        user_service = UserService()
-        logger.info("User service initialized")
-        
-        logger.info("All services initialized successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize services: {str(e)}")
-        raise
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JSONLogFormatter())
+    
+    # Configure the root logger only while the app runs; stop() puts it back as it was
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers[:] = [TracebackQueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
     
-    yield
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
     
-    # Shutdown
-    logger.info("Shutting down AI Yield Farming API...")
+    def stop():
+        # Restore first so nothing lands in the queue after the listener drains it
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        listener.stop()
     
-    # Cleanup services
-    if web3_service:
-        await web3_service.cleanup()
-    if ml_service:
-        await ml_service.cleanup()
+    return stop
+
+async def _cleanup_services(services: List[Any]):
+    """Clean up initialized services concurrently"""
+    
+    results = await asyncio.gather(
+        *(service.cleanup() for service in services),
+        return_exceptions=True
+    )
+    
+    for service, result in zip(services, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to clean up %s: %s", type(service).__name__, result)
     
     logger.info("Shutdown complete")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager"""
+    async with AsyncExitStack() as stack:
+        # Startup; exit callbacks unwind in reverse registration order
+        stop_log_listener = _start_log_listener()
+        stack.callback(stop_log_listener)
+        
+        logger.info("Starting AI Yield Farming API...")
+        app.state.services_ready = False
+        
+        # Initialize database schema (production relies on Alembic migrations)
+        if os.getenv("RUN_DDL_ON_STARTUP") == "1":
+            await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+            logger.info("Database initialized")
+        
+        # Initialize services; anything initialized is cleaned up on exit
+        initialized: List[Any] = []
+        stack.push_async_callback(_cleanup_services, initialized)
+        
+        try:
+            for name, provider in (("Web3", get_web3_service_dependency),
+                                   ("ML", get_ml_service_dependency)):
+                service = provider()
+                await service.initialize()
+                initialized.append(service)
+                logger.info("%s service initialized", name)
+            
+            # Vault service
+            get_vault_service_dependency()
+            logger.info("Vault service initialized")
+            
+            # User service
+            get_user_service_dependency()
+            logger.info("User service initialized")
+            
+            app.state.services_ready = True
+            logger.info("All services initialized successfully")
+            
+        except Exception as e:
+            logger.error("Failed to initialize services: %s", e)
+            raise
+        
+        yield
+        
+        # Shutdown
+        logger.info("Shutting down AI Yield Farming API...")
+        app.state.services_ready = False
+
 # Create FastAPI app
 app = FastAPI(
     title="AI-Driven Yield Farming Optimization API",
@@ -94,104 +162,168 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=[
+        origin.strip()
+        for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+        if origin.strip()
+    ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Security
-security = HTTPBearer()
+# Compress larger JSON bodies; tiny probe payloads are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-# Include routers
-app.include_router(
-    users.router,
-    prefix="/api/v1/users",
-    tags=["users"]
-)
+# Request counters; itertools.count.__next__ is atomic under the GIL, so no lock
+app.state.request_counter = itertools.count(1)
+app.state.ok_counter = itertools.count(1)
+app.state.request_count = 0
+app.state.ok_count = 0
 
-app.include_router(
-    vaults.router,
-    prefix="/api/v1/vaults",
-    tags=["vaults"]
-)
+@app.middleware("http")
+async def request_context_middleware(request: Request, call_next):
+    """Stamp each request with a single timezone-aware ISO timestamp and count it"""
+    request.state.now_iso = datetime.now(timezone.utc).isoformat()
+    app.state.request_count = next(app.state.request_counter)
+    
+    response = await call_next(request)
+    
+    if response.status_code < 500:
+        app.state.ok_count = next(app.state.ok_counter)
+    return response
 
-app.include_router(
-    strategies.router,
-    prefix="/api/v1/strategies",
-    tags=["strategies"]
-)
+def _request_timestamp(request: Request) -> str:
+    """Get the timestamp stamped on the request by the middleware"""
+    now_iso = getattr(request.state, "now_iso", None)
+    return now_iso or datetime.now(timezone.utc).isoformat()
 
-app.include_router(
-    analytics.router,
-    prefix="/api/v1/analytics",
-    tags=["analytics"]
+# Include routers: (module, prefix, tag), hottest prefix first since
+# Starlette matches routes in registration order
+ROUTERS = (
+    ("vaults", "/api/v1/vaults", "vaults"),
+    ("users", "/api/v1/users", "users"),
+    ("strategies", "/api/v1/strategies", "strategies"),
+    ("analytics", "/api/v1/analytics", "analytics"),
+    ("automation", "/api/v1/automation", "automation"),
 )
 
-app.include_router(
-    automation.router,
-    prefix="/api/v1/automation",
-    tags=["automation"]
-)
+for module_name, prefix, tag in ROUTERS:
+    router_module = importlib.import_module(f".routers.{module_name}", __package__)
+    app.include_router(router_module.router, prefix=prefix, tags=[tag])
+
+# Response cache for high-frequency probe endpoints
+CACHE_TTL_SHORT = 5     # seconds - health
+CACHE_TTL_NORMAL = 15   # seconds - metrics
+
+_response_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_response_cache_locks: Dict[str, asyncio.Lock] = {}
+
+async def _cached(key: str,
+                  ttl: float,
+                  coro_factory: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Serve a payload from the TTL cache, refreshing it under a per-key lock"""
+    
+    entry = _response_cache.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    
+    lock = _response_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another request may have refreshed the entry while we waited
+        entry = _response_cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        
+        try:
+            payload = await coro_factory()
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.error("Failed to refresh cached %s: %s", key, e)
+            return {**entry[1], "stale": True}
+        
+        _response_cache[key] = (time.monotonic(), payload)
+        return payload
+
+def _cache_etag(key: str) -> str:
+    """Build an ETag from the generation time of a cached payload"""
+    generated_at = _response_cache[key][0]
+    return f'"{key}-{int(generated_at * 1e6):x}"'
 
 # Root endpoints
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint"""
+    now_iso = request.state.now_iso
+    return await _cached("root", CACHE_TTL_SHORT, lambda: _build_root(now_iso))
+
+async def _build_root(now_iso: str) -> Dict[str, Any]:
+    """Build root endpoint payload"""
     return {
         "message": "AI-Driven Yield Farming Optimization API",
         "version": "1.0.0",
         "status": "operational",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso
     }
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
+    now_iso = request.state.now_iso
+    health_status = await _cached("health", CACHE_TTL_SHORT, lambda: _build_health_status(now_iso))
+    
+    etag = _cache_etag("health")
+    headers = {"ETag": etag, "Cache-Control": f"max-age={CACHE_TTL_SHORT}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse(health_status, headers=headers)
+
+async def _build_health_status(now_iso: str) -> Dict[str, Any]:
+    """Build health check payload"""
     
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "services": {}
     }
     
-    # Check Web3 service
-    if web3_service:
-        try:
-            is_connected = await web3_service.is_connected()
-            health_status["services"]["web3"] = {
-                "status": "healthy" if is_connected else "unhealthy",
-                "connected": is_connected
-            }
-        except Exception as e:
-            health_status["services"]["web3"] = {
-                "status": "unhealthy",
-                "error": str(e)
-            }
+    # Probe initialized services concurrently
+    probes = {}
+    if getattr(app.state, "services_ready", False):
+        probes["web3"] = get_web3_service_dependency().is_connected()
+        probes["ml"] = get_ml_service_dependency().get_model_status()
     else:
         health_status["services"]["web3"] = {"status": "not_initialized"}
+        health_status["services"]["ml"] = {"status": "not_initialized"}
     
-    # Check ML service
-    if ml_service:
-        try:
-            model_status = await ml_service.get_model_status()
-            health_status["services"]["ml"] = {
-                "status": "healthy",
-                "models": model_status
+    results = await asyncio.gather(*probes.values(), return_exceptions=True)
+    
+    for name, result in zip(probes, results):
+        if isinstance(result, Exception):
+            health_status["services"][name] = {
+                "status": "unhealthy",
+                "error": str(result)
             }
-        except Exception as e:
+        elif name == "web3":
+            health_status["services"]["web3"] = {
+                "status": "healthy" if result else "unhealthy",
+                "connected": result
+            }
+        else:
             health_status["services"]["ml"] = {
-                "status": "unhealthy",
-                "error": str(e)
+                "status": "healthy",
+                "models": result
             }
-    else:
-        health_status["services"]["ml"] = {"status": "not_initialized"}
     
     # Determine overall status
     service_statuses = [
@@ -206,199 +338,265 @@ async def health_check():
     
     return health_status
 
+# Static system information, built and serialized once at import
+_SYSTEM_INFO = MappingProxyType({
+    "api_version": "1.0.0",
+    "environment": os.getenv("NODE_ENV", "development"),
+    "blockchain_network": os.getenv("CHAIN_ID", "1"),
+    "features": {
+        "ai_predictions": True,
+        "automated_rebalancing": True,
+        "multi_protocol_support": True,
+        "risk_management": True,
+        "circuit_breakers": True
+    },
+    "supported_protocols": [
+        "Compound",
+        "Aave",
+        "Yearn Finance",
+        "Uniswap V3"
+    ],
+    "supported_tokens": [
+        "USDC",
+        "USDT", 
+        "DAI",
+        "ETH",
+        "WBTC"
+    ]
+})
+_SYSTEM_INFO_BYTES = orjson.dumps(dict(_SYSTEM_INFO))
+ETAG_INFO = f'"{hashlib.md5(_SYSTEM_INFO_BYTES).hexdigest()}"'
+_SYSTEM_INFO_HEADERS = {"ETag": ETAG_INFO, "Cache-Control": "max-age=60"}
+
 @app.get("/api/v1/system/info")
-async def system_info():
+async def system_info(request: Request):
     """Get system information"""
+    if request.headers.get("if-none-match") == ETAG_INFO:
+        return Response(status_code=304, headers=_SYSTEM_INFO_HEADERS)
     
-    info = {
-        "api_version": "1.0.0",
-        "environment": os.getenv("NODE_ENV", "development"),
-        "blockchain_network": os.getenv("CHAIN_ID", "1"),
-        "features": {
-            "ai_predictions": True,
-            "automated_rebalancing": True,
-            "multi_protocol_support": True,
-            "risk_management": True,
-            "circuit_breakers": True
-        },
-        "supported_protocols": [
-            "Compound",
-            "Aave",
-            "Yearn Finance",
-            "Uniswap V3"
-        ],
-        "supported_tokens": [
-            "USDC",
-            "USDT", 
-            "DAI",
-            "ETH",
-            "WBTC"
-        ]
-    }
-    
-    return info
+    return Response(
+        content=_SYSTEM_INFO_BYTES,
+        media_type="application/json",
+        headers=_SYSTEM_INFO_HEADERS
+    )
 
 @app.get("/api/v1/system/metrics")
-async def system_metrics():
+async def system_metrics(request: Request):
     """Get system performance metrics"""
+    now_iso = request.state.now_iso
+    return await _cached("system_metrics", CACHE_TTL_NORMAL, lambda: _build_system_metrics(now_iso))
+
+async def _build_system_metrics(now_iso: str) -> Dict[str, Any]:
+    """Build system metrics payload"""
     
     metrics = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "uptime": "calculated_uptime",  # Would calculate actual uptime
         "requests": {
-            "total": 0,  # Would track actual requests
-            "success_rate": 0.99
+            "total": app.state.request_count,
+            "success_rate": (
+                app.state.ok_count / app.state.request_count
+                if app.state.request_count > 0 else 1.0
+            )
         },
         "blockchain": {},
         "ml_models": {},
         "automation": {}
     }
     
-    # Get Web3 metrics
-    if web3_service:
-        try:
-            web3_metrics = await web3_service.get_metrics()
-            metrics["blockchain"] = web3_metrics
-        except Exception as e:
-            logger.error(f"Failed to get Web3 metrics: {str(e)}")
+    # Collect Web3 and ML metrics concurrently
+    sources = {}
+    if getattr(app.state, "services_ready", False):
+        sources["blockchain"] = ("Web3", get_web3_service_dependency().get_metrics())
+        sources["ml_models"] = ("ML", get_ml_service_dependency().get_metrics())
     
-    # Get ML metrics
-    if ml_service:
-        try:
-            ml_metrics = await ml_service.get_metrics()
-            metrics["ml_models"] = ml_metrics
-        except Exception as e:
-            logger.error(f"Failed to get ML metrics: {str(e)}")
+    results = await asyncio.gather(
+        *(coro for _, coro in sources.values()),
+        return_exceptions=True
+    )
+    
+    for (key, (label, _)), result in zip(sources.items(), results):
+        if isinstance(result, Exception):
+            logger.error("Failed to get %s metrics: %s", label, result)
+        else:
+            metrics[key] = result
     
     return metrics
 
 # Error handlers
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request, exc):
+async def http_exception_handler(request: Request, exc):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
                 "code": exc.status_code,
                 "message": exc.detail,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_timestamp(request)
             }
         }
     )
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request, exc):
+async def general_exception_handler(request: Request, exc):
     """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
                 "code": 500,
                 "message": "Internal server error",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_timestamp(request)
             }
         }
     )
 
 # Dependency providers
-def get_web3_service_dependency():
+@lru_cache(maxsize=1)
+def get_web3_service_dependency() -> Web3Service:
     """Get Web3 service dependency"""
-    if not web3_service:
-        raise HTTPException(
-            status_code=503,
-            detail="Web3 service not available"
-        )
-    return web3_service
+    return Web3Service(
+        provider_url=os.getenv('INFURA_API_KEY', 'http://localhost:8545'),
+        private_key=os.getenv('PRIVATE_KEY')
+    )
 
-def get_ml_service_dependency():
+@lru_cache(maxsize=1)
+def get_ml_service_dependency() -> MLService:
     """Get ML service dependency"""
-    if not ml_service:
-        raise HTTPException(
-            status_code=503,
-            detail="ML service not available"
-        )
-    return ml_service
+    return MLService()
 
-def get_vault_service_dependency():
+@lru_cache(maxsize=1)
+def get_vault_service_dependency() -> VaultService:
     """Get vault service dependency"""
-    if not vault_service:
-        raise HTTPException(
-            status_code=503,
-            detail="Vault service not available"
-        )
-    return vault_service
+    return VaultService(get_web3_service_dependency(), get_ml_service_dependency())
 
-def get_user_service_dependency():
+@lru_cache(maxsize=1)
+def get_user_service_dependency() -> UserService:
     """Get user service dependency"""
-    if not user_service:
-        raise HTTPException(
-            status_code=503,
-            detail="User service not available"
-        )
-    return user_service
+    return UserService()
 
-# Background tasks
+# Background tasks (executed by Celery workers, not the API process)
 @app.post("/api/v1/system/tasks/data-collection")
-async def trigger_data_collection(background_tasks: BackgroundTasks):
+async def trigger_data_collection(request: Request):
     """Trigger background data collection"""
     
-    async def collect_data():
-        """Background data collection task"""
-        try:
-            if ml_service:
-                await ml_service.collect_training_data()
-                logger.info("Data collection completed")
-        except Exception as e:
-            logger.error(f"Data collection failed: {str(e)}")
-    
-    background_tasks.add_task(collect_data)
+    task = await asyncio.to_thread(collect_training_data.delay)
     
     return {
-        "message": "Data collection task started",
-        "timestamp": datetime.now().isoformat()
+        "message": "Data collection task queued",
+        "task_id": task.id,
+        "timestamp": request.state.now_iso
     }
 
 @app.post("/api/v1/system/tasks/model-training")
-async def trigger_model_training(background_tasks: BackgroundTasks):
+async def trigger_model_training(request: Request):
     """Trigger background model training"""
     
-    async def train_models():
-        """Background model training task"""
+    task = await asyncio.to_thread(retrain_models.delay)
+    
+    return {
+        "message": "Model training task queued",
+        "task_id": task.id,
+        "timestamp": request.state.now_iso
+    }
+
+@app.get("/api/v1/system/tasks/{task_id}")
+async def get_task(task_id: str):
+    """Get background task status"""
+    return await asyncio.to_thread(get_task_status, task_id)
+
+# Real-time vault update fan-out: one producer per vault, one queue per connection
+VAULT_UPDATE_INTERVAL = 5  # seconds
+
+_vault_subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+_vault_producers: Dict[str, asyncio.Task] = {}
+
+async def _produce_vault_updates(vault_id: str, vault_service: VaultService):
+    """Poll vault data once per interval and fan it out to every subscriber"""
+    
+    while True:
         try:
-            if ml_service:
-                await ml_service.retrain_models()
-                logger.info("Model training completed")
+            vault_data = await vault_service.get_vault_realtime_data(vault_id)
+            message = orjson.dumps(vault_data).decode()
+            
+            for updates in _vault_subscribers.get(vault_id, ()):
+                # Slow consumers only ever see the latest update
+                if updates.full():
+                    updates.get_nowait()
+                updates.put_nowait(message)
+        
         except Exception as e:
-            logger.error(f"Model training failed: {str(e)}")
+            logger.error("Vault update producer error for %s: %s", vault_id, e)
+        
+        await asyncio.sleep(VAULT_UPDATE_INTERVAL)
+
+def _subscribe_vault(vault_id: str, vault_service: VaultService) -> asyncio.Queue:
+    """Register a subscriber queue, starting the vault producer on first use"""
     
-    background_tasks.add_task(train_models)
+    updates = asyncio.Queue(maxsize=1)
+    _vault_subscribers[vault_id].add(updates)
     
-    return {
-        "message": "Model training task started",
-        "timestamp": datetime.now().isoformat()
-    }
+    if vault_id not in _vault_producers:
+        _vault_producers[vault_id] = asyncio.create_task(
+            _produce_vault_updates(vault_id, vault_service)
+        )
+    
+    return updates
+
+def _unsubscribe_vault(vault_id: str, updates: asyncio.Queue):
+    """Remove a subscriber queue, stopping the producer after the last one leaves"""
+    
+    subscribers = _vault_subscribers.get(vault_id)
+    if subscribers is None:
+        return
+    
+    subscribers.discard(updates)
+    if not subscribers:
+        del _vault_subscribers[vault_id]
+        producer = _vault_producers.pop(vault_id, None)
+        if producer:
+            producer.cancel()
 
 # WebSocket endpoints for real-time updates
 @app.websocket("/ws/vault/{vault_id}")
-async def vault_websocket(websocket, vault_id: str):
+async def vault_websocket(websocket: WebSocket,
+                          vault_id: str,
+                          vault_service: VaultService = Depends(get_vault_service_dependency)):
     """WebSocket endpoint for real-time vault updates"""
     await websocket.accept()
+    updates = _subscribe_vault(vault_id, vault_service)
+    
+    # Race each update against the client's next frame so a stalled producer can't park this handler
+    next_update = asyncio.create_task(updates.get())
+    next_frame = asyncio.create_task(websocket.receive())
     
     try:
         while True:
-            # Send real-time vault data
-            if vault_service:
-                vault_data = await vault_service.get_vault_realtime_data(vault_id)
-                await websocket.send_json(vault_data)
+            done, _ = await asyncio.wait(
+                {next_update, next_frame}, return_when=asyncio.FIRST_COMPLETED
+            )
             
-            await asyncio.sleep(5)  # Update every 5 seconds
+            if next_frame in done:
+                if next_frame.result()["type"] == "websocket.disconnect":
+                    logger.info("WebSocket client disconnected from vault %s", vault_id)
+                    break
+                next_frame = asyncio.create_task(websocket.receive())
             
+            if next_update in done:
+                await websocket.send_text(next_update.result())
+                next_update = asyncio.create_task(updates.get())
+            
+    except WebSocketDisconnect:
+        logger.info("WebSocket client disconnected from vault %s", vault_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {str(e)}")
-    finally:
+        logger.error("WebSocket error: %s", e)
         await websocket.close()
+    finally:
+        next_update.cancel()
+        next_frame.cancel()
+        _unsubscribe_vault(vault_id, updates)
 
 if __name__ == "__main__":
     # Run the application
@@ -407,5 +605,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=int(os.getenv("API_PORT", 8000)),
         reload=os.getenv("NODE_ENV") == "development",
+        workers=int(os.getenv("API_WORKERS", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=int(os.getenv("API_TIMEOUT_KEEP_ALIVE", 30)),
+        limit_concurrency=int(os.getenv("API_LIMIT_CONCURRENCY", 1000)),
         log_level="info"
     )
@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for production deployments.
+Runs one Uvicorn worker process per CPU core; use `uvicorn.run` in main.py for development.
+
+    gunicorn -c backend/gunicorn.conf.py backend.api.main:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("API_WORKERS", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("API_LIMIT_CONCURRENCY", 1000))
+
+timeout = 60
+graceful_timeout = 30
+keepalive = int(os.getenv("API_TIMEOUT_KEEP_ALIVE", 30))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = "info"
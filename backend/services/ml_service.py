@@ -4,15 +4,24 @@ Provides predictions, strategy recommendations, and model management.
 """
 
 import asyncio
+import concurrent.futures
+import gc
 import logging
+import multiprocessing
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import os
 import joblib
 from dataclasses import dataclass
 import json
+import tempfile
+import time
+from cachetools import TTLCache
 
 # Import ML modules
 import sys
@@ -25,6 +34,72 @@ from data.feature_engineering import DeFiFeatureEngineer
 
 logger = logging.getLogger(__name__)
 
+# Technical indicators need a 20-row window before features are meaningful
+MIN_ROWS_FOR_FEATURES = 20
+
+try:
+    from numba import njit
+except ImportError:  # Run the kernels as plain NumPy without the JIT
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True, fastmath=True)
+def _adjust_allocations(values: np.ndarray, multiplier: float, cash_fraction: float) -> np.ndarray:
+    """Scale, normalize and shrink allocation weights to make room for cash"""
+    
+    adjusted = values * multiplier
+    total = adjusted.sum()
+    if total > 0:
+        adjusted /= total
+    adjusted *= (1.0 - cash_fraction)
+    
+    return adjusted
+
+def _engineer_features_worker(raw_path: str, data_path: str) -> DeFiFeatureEngineer:
+    """Fit the feature pipeline on raw history in a training process"""
+    
+    engineer = DeFiFeatureEngineer()
+    processed = engineer.engineer_features(pd.read_parquet(raw_path), fit=True)
+    processed.to_parquet(data_path, index=False)
+    
+    return engineer
+
+def _train_yield_worker(data_path: str,
+                        model_path: str,
+                        feature_cols: List[str],
+                        target_cols: List[str]) -> Dict[str, Any]:
+    """Retrain and save the yield predictor in a training process"""
+    
+    data = pd.read_parquet(data_path)
+    
+    predictor = YieldPredictor()
+    if os.path.exists(model_path):
+        predictor.load_model(model_path)
+    
+    results = predictor.train(data=data, feature_cols=feature_cols, target_cols=target_cols)
+    predictor.save_model(model_path)
+    
+    return {'val_metrics': results.get('val_metrics', {})}
+
+def _train_strategy_worker(data_path: str, model_path: str, episodes: int) -> Dict[str, Any]:
+    """Retrain and save the strategy selector in a training process"""
+    
+    data = pd.read_parquet(data_path)
+    
+    selector = StrategySelector()
+    results = selector.train(data=data, episodes=episodes)
+    selector.save_model(model_path)
+    
+    return {'avg_reward': float(results.get('avg_reward', 0.0))}
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """Cached value with its monotonic insertion time"""
+    data: Any
+    mono_ts: float
+
 @dataclass
 class YieldPrediction:
     """Yield prediction result"""
@@ -67,15 +142,41 @@ class MLService:
         # Model paths
         self.model_paths = {
             'yield_predictor': 'ml/models/trained/yield_predictor_latest.h5',
-            'strategy_selector': 'ml/models/trained/strategy_selector_latest.h5'
+            'strategy_selector': 'ml/models/trained/strategy_selector_latest.h5',
+            'feature_engineer': 'ml/models/trained/feature_engineer_latest.pkl'
         }
         
+        # Models are retrained by the task worker; reload them here when their files change
+        self.model_reload_interval = 300  # 5 minutes
+        self._models_mtime = 0.0
+        self._reload_task = None
+        
         # Model status
         self.model_status = {}
         
+        # Horizons (days) the loaded yield predictor was trained to forecast
+        self._supported_horizons = set()
+        
         # Prediction cache
-        self.prediction_cache = {}
         self.cache_ttl = 300  # 5 minutes
+        self.prediction_cache = TTLCache(maxsize=4096, ttl=self.cache_ttl)
+        
+        # Shared history pull; shorter windows are sliced from it
+        self.history_days = 90
+        self._history_cache = {}
+        self._history_lock = asyncio.Lock()
+        
+        # Engineered features keyed by the input window they were built from
+        self._features_cache = TTLCache(maxsize=256, ttl=self.cache_ttl)
+        
+        # Micro-batching of concurrent yield predictions
+        self.max_batch_size = 32
+        self.batch_timeout = 0.005  # 5 ms
+        self._predict_queue = None
+        self._batch_task = None
+        
+        # Retraining runs in a separate process so it never blocks the event loop
+        self._train_executor = None
         
         # Performance metrics
         self.metrics = {
@@ -94,12 +195,17 @@ class MLService:
             # Load trained models
             await self._load_models()
             
-            # Initialize data collector
-            self.data_collector = DeFiDataCollector()
+            # Open one long-lived data collector so requests share its connection pool
+            self.data_collector = await DeFiDataCollector().__aenter__()
             
             # Start background tasks
-            asyncio.create_task(self._periodic_model_update())
-            asyncio.create_task(self._cache_cleanup())
+            self._reload_task = asyncio.create_task(self._watch_model_files())
+            self._predict_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._predict_batcher())
+            # Spawn rather than fork so the child does not inherit the loop, threads and sockets
+            self._train_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
             
             logger.info("ML service initialized successfully")
             
@@ -110,26 +216,68 @@ class MLService:
     async def _load_models(self):
         """Load trained ML models"""
         
-        # Load yield predictor
+        # Taken before loading so a file replaced mid-load is picked up on the next check
+        self._models_mtime = await asyncio.to_thread(self._model_files_mtime)
+        
+        # Keras loads block on disk and graph construction; run both off the event loop
+        yield_status, strategy_status = await asyncio.gather(
+            asyncio.to_thread(self._load_yield_sync),
+            asyncio.to_thread(self._load_strategy_sync)
+        )
+        
+        self.model_status['yield_predictor'] = yield_status
+        self.model_status['strategy_selector'] = strategy_status
+        
+        # Scale inference inputs the way the loaded yield model was trained
+        engineer_path = self.model_paths['feature_engineer']
+        if os.path.exists(engineer_path):
+            # Memory-map the fitted scaler's arrays so API workers share the page cache
+            self.feature_engineer = await asyncio.to_thread(joblib.load, engineer_path, mmap_mode='r')
+        self._features_cache.clear()
+        self.prediction_cache.clear()
+        
+        # Release transient copies made while deserializing the models
+        gc.collect()
+    
+    def _model_files_mtime(self) -> float:
+        """Newest modification time across the saved model files"""
+        
+        return max(
+            (os.stat(path).st_mtime for path in self.model_paths.values() if os.path.exists(path)),
+            default=0.0
+        )
+    
+    def _load_yield_sync(self) -> ModelStatus:
+        """Load the yield predictor model"""
+        
         try:
-            if os.path.exists(self.model_paths['yield_predictor']):
-                self.yield_predictor = YieldPredictor()
-                self.yield_predictor.load_model(self.model_paths['yield_predictor'])
+            try:
+                model_stat = os.stat(self.model_paths['yield_predictor'])
+            except FileNotFoundError:
+                model_stat = None
+            
+            if model_stat is not None:
+                # Keep serving the current model unless the new one loads cleanly
+                predictor = YieldPredictor()
+                predictor.load_model(self.model_paths['yield_predictor'])
+                self._supported_horizons = {
+                    int(col[len('apy_future_'):-1])
+                    for col in predictor.target_columns
+                    if col.startswith('apy_future_') and col.endswith('d')
+                }
+                self.yield_predictor = predictor
                 
-                self.model_status['yield_predictor'] = ModelStatus(
+                logger.info("Yield predictor model loaded")
+                return ModelStatus(
                     name='Yield Predictor',
                     version='1.0',
-                    last_trained=datetime.fromtimestamp(
-                        os.path.getmtime(self.model_paths['yield_predictor'])
-                    ),
+                    last_trained=datetime.fromtimestamp(model_stat.st_mtime),
                     accuracy=0.85,  # Would load from model metadata
                     status='active'
                 )
-                
-                logger.info("Yield predictor model loaded")
             else:
                 logger.warning("Yield predictor model not found")
-                self.model_status['yield_predictor'] = ModelStatus(
+                return ModelStatus(
                     name='Yield Predictor',
                     version='1.0',
                     last_trained=None,
@@ -139,7 +287,7 @@ class MLService:
                 )
         except Exception as e:
             logger.error(f"Failed to load yield predictor: {str(e)}")
-            self.model_status['yield_predictor'] = ModelStatus(
+            return ModelStatus(
                 name='Yield Predictor',
                 version='1.0',
                 last_trained=None,
@@ -147,27 +295,32 @@ class MLService:
                 status='error',
                 error_message=str(e)
             )
+    
+    def _load_strategy_sync(self) -> ModelStatus:
+        """Load the strategy selector model"""
         
-        # Load strategy selector
         try:
-            if os.path.exists(self.model_paths['strategy_selector']):
-                self.strategy_selector = StrategySelector()
-                self.strategy_selector.load_model(self.model_paths['strategy_selector'])
+            try:
+                model_stat = os.stat(self.model_paths['strategy_selector'])
+            except FileNotFoundError:
+                model_stat = None
+            
+            if model_stat is not None:
+                selector = StrategySelector()
+                selector.load_model(self.model_paths['strategy_selector'])
+                self.strategy_selector = selector
                 
-                self.model_status['strategy_selector'] = ModelStatus(
+                logger.info("Strategy selector model loaded")
+                return ModelStatus(
                     name='Strategy Selector',
                     version='1.0',
-                    last_trained=datetime.fromtimestamp(
-                        os.path.getmtime(self.model_paths['strategy_selector'])
-                    ),
+                    last_trained=datetime.fromtimestamp(model_stat.st_mtime),
                     accuracy=0.78,  # Would load from model metadata
                     status='active'
                 )
-                
-                logger.info("Strategy selector model loaded")
             else:
                 logger.warning("Strategy selector model not found")
-                self.model_status['strategy_selector'] = ModelStatus(
+                return ModelStatus(
                     name='Strategy Selector',
                     version='1.0',
                     last_trained=None,
@@ -177,7 +330,7 @@ class MLService:
                 )
         except Exception as e:
             logger.error(f"Failed to load strategy selector: {str(e)}")
-            self.model_status['strategy_selector'] = ModelStatus(
+            return ModelStatus(
                 name='Strategy Selector',
                 version='1.0',
                 last_trained=None,
@@ -194,52 +347,76 @@ class MLService:
         if not self.yield_predictor:
             raise ValueError("Yield predictor model not available")
         
+        if self._supported_horizons and horizon_days not in self._supported_horizons:
+            raise ValueError(
+                f"Unsupported prediction horizon {horizon_days}d, "
+                f"expected one of {sorted(self._supported_horizons)}"
+            )
+        
         # Check cache
-        cache_key = f"yields_{'-'.join(protocols)}_{horizon_days}"
-        if self._is_cache_valid(cache_key):
+        cache_key = ('yields', tuple(sorted(protocols)), horizon_days)
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
             self.metrics['cache_hits'] += 1
-            return self.prediction_cache[cache_key]['data']
+            return cached
         
         self.metrics['cache_misses'] += 1
         
         try:
             # Collect recent data
-            async with self.data_collector as collector:
-                recent_data = await collector.collect_historical_data(days=30)
+            recent_data = await self._get_history(days=30)
             
             # Filter for requested protocols
-            protocol_data = recent_data[recent_data['protocol'].isin(protocols)]
+            protocol_data = self._select_protocols(recent_data, protocols)
             
             if protocol_data.empty:
                 logger.warning(f"No data found for protocols: {protocols}")
                 return []
             
+            # Indicator windows run per protocol, so each one needs enough rows of its own
+            row_counts = protocol_data.groupby('protocol').size()
+            short = row_counts.index[row_counts < MIN_ROWS_FOR_FEATURES]
+            if len(short):
+                logger.warning(f"Not enough data to engineer features for protocols: {list(short)}")
+                protocol_data = protocol_data[~protocol_data['protocol'].isin(short)]
+                if protocol_data.empty:
+                    return []
+            
             # Engineer features
-            processed_data = self.feature_engineer.engineer_features(
-                protocol_data, fit=False
-            )
+            processed_data = self._engineer_features_cached(protocol_data)
             
             # Make predictions
-            predictions_df = self.yield_predictor.predict(processed_data)
+            processed_data = self._with_float32_features(
+                processed_data, self.yield_predictor.feature_columns
+            )
+            predictions_df = await self._predict_batched(processed_data)
             
             # Convert to YieldPrediction objects
             predictions = []
-            for _, row in predictions_df.iterrows():
-                if row['target'] == f'apy_future_{horizon_days}d':
-                    predictions.append(YieldPrediction(
-                        protocol=row['protocol'],
-                        predicted_apy=row['predicted_value'],
+            if not predictions_df.empty:
+                mask = predictions_df['target'].to_numpy() == f'apy_future_{horizon_days}d'
+                selected = predictions_df.loc[mask, ['protocol', 'predicted_value']]
+                
+                protocols_out = selected['protocol'].to_numpy()
+                predicted_values = selected['predicted_value'].to_numpy(dtype=float)
+                risk_scores = self._risk_vector(protocols_out, self._protocol_means(processed_data))
+                
+                timestamp = datetime.now()
+                predictions = [
+                    YieldPrediction(
+                        protocol=protocol,
+                        predicted_apy=float(predicted_apy),
                         confidence=0.8,  # Would calculate actual confidence
                         prediction_horizon=horizon_days,
-                        risk_score=self._calculate_risk_score(row['protocol'], processed_data),
-                        timestamp=datetime.now()
-                    ))
+                        risk_score=float(risk_score),
+                        timestamp=timestamp
+                    )
+                    for protocol, predicted_apy, risk_score
+                    in zip(protocols_out, predicted_values, risk_scores)
+                ]
             
             # Cache results
-            self.prediction_cache[cache_key] = {
-                'data': predictions,
-                'timestamp': datetime.now()
-            }
+            self.prediction_cache[cache_key] = predictions
             
             self.metrics['predictions_made'] += len(predictions)
             
@@ -260,25 +437,26 @@ class MLService:
             raise ValueError("Strategy selector model not available")
         
         # Check cache
-        cache_key = f"strategy_{user_risk_profile}_{investment_amount}_{'-'.join(available_protocols)}"
-        if self._is_cache_valid(cache_key):
+        cache_key = (
+            'strategy', user_risk_profile, round(investment_amount, 2),
+            tuple(sorted(available_protocols))
+        )
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
             self.metrics['cache_hits'] += 1
-            return self.prediction_cache[cache_key]['data']
+            return cached
         
         self.metrics['cache_misses'] += 1
         
         try:
             # Collect current market data
-            async with self.data_collector as collector:
-                current_data = await collector.collect_historical_data(days=7)
+            current_data = await self._get_history(days=7)
             
             # Filter for available protocols
-            protocol_data = current_data[current_data['protocol'].isin(available_protocols)]
+            protocol_data = self._select_protocols(current_data, available_protocols)
             
             # Engineer features
-            processed_data = self.feature_engineer.engineer_features(
-                protocol_data, fit=False
-            )
+            processed_data = self._engineer_features_cached(protocol_data)
             
             # Get allocation recommendation
             allocation = self.strategy_selector.predict_allocation(processed_data)
@@ -289,11 +467,12 @@ class MLService:
             )
             
             # Calculate expected metrics
+            protocol_means = self._protocol_means(processed_data)
             expected_apy = self._calculate_expected_apy(
-                adjusted_allocation, processed_data
+                adjusted_allocation, protocol_means
             )
             risk_score = self._calculate_portfolio_risk(
-                adjusted_allocation, processed_data
+                adjusted_allocation, protocol_means
             )
             
             recommendation = StrategyRecommendation(
@@ -306,10 +485,7 @@ class MLService:
             )
             
             # Cache results
-            self.prediction_cache[cache_key] = {
-                'data': recommendation,
-                'timestamp': datetime.now()
-            }
+            self.prediction_cache[cache_key] = recommendation
             
             self.metrics['recommendations_generated'] += 1
             
@@ -320,6 +496,126 @@ class MLService:
             logger.error(f"Failed to generate strategy recommendation: {str(e)}")
             raise
     
+    async def _get_history(self, days: int) -> pa.Table:
+        """Get the last `days` of history from one shared, cached pull"""
+        
+        today = datetime.now().date()
+        
+        async with self._history_lock:
+            entry = self._history_cache.get(today)
+            if entry is None or time.monotonic() - entry.mono_ts >= self.cache_ttl:
+                data = await self.data_collector.collect_historical_table(
+                    days=max(days, self.history_days)
+                )
+                entry = _CacheEntry(data, time.monotonic())
+                
+                # Only today's pull is ever read again
+                self._history_cache = {today: entry}
+        
+        data = entry.data
+        if data.num_rows == 0 or days >= self.history_days:
+            return data
+        
+        # Arrow filters share the cached buffers instead of copying a DataFrame per window
+        cutoff = pa.scalar(
+            datetime.now() - timedelta(days=days), type=data.schema.field('timestamp').type
+        )
+        return data.filter(pc.greater_equal(data['timestamp'], cutoff))
+    
+    def _select_protocols(self, data: pa.Table, protocols: List[str]) -> pd.DataFrame:
+        """Filter history to the given protocols, materializing pandas only for feature engineering"""
+        
+        if data.num_rows == 0:
+            return data.to_pandas()
+        
+        mask = pc.is_in(data['protocol'], value_set=pa.array(protocols, type=pa.string()))
+        return data.filter(mask).to_pandas()
+    
+    def _engineer_features_cached(self, protocol_data: pd.DataFrame) -> pd.DataFrame:
+        """Engineer inference features, reusing the result for an identical input window"""
+        
+        if protocol_data.empty:
+            return self.feature_engineer.engineer_features(protocol_data, fit=False)
+        
+        cache_key = (
+            tuple(sorted(protocol_data['protocol'].unique())),
+            pd.Timestamp(protocol_data['timestamp'].max()).value,
+            len(protocol_data)
+        )
+        
+        processed_data = self._features_cache.get(cache_key)
+        if processed_data is None:
+            processed_data = self.feature_engineer.engineer_features(protocol_data, fit=False)
+            self._features_cache[cache_key] = processed_data
+        
+        return processed_data
+    
+    async def _predict_batched(self, processed_data: pd.DataFrame) -> pd.DataFrame:
+        """Queue a yield prediction to share a model call with concurrent requests"""
+        
+        if self._batch_task is None or self._batch_task.done():
+            return self.yield_predictor.predict(processed_data)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._predict_queue.put((processed_data, future))
+        return await future
+    
+    async def _predict_batcher(self):
+        """Coalesce queued yield predictions into one model call per protocol set"""
+        
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._predict_queue.get()]
+            
+            # Collect more requests until the batch is full or the window closes
+            deadline = loop.time() + self.batch_timeout
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._predict_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Market features are ranked across the protocols of one request, so only
+            # requests for the same protocol set can share rows and a model call
+            groups: Dict[frozenset, List[Tuple[pd.DataFrame, asyncio.Future]]] = {}
+            for data, future in batch:
+                groups.setdefault(frozenset(data['protocol'].unique()), []).append((data, future))
+            
+            for members in groups.values():
+                try:
+                    if len(members) == 1:
+                        combined = members[0][0]
+                    else:
+                        combined = pd.concat(
+                            [data for data, _ in members], ignore_index=True
+                        ).drop_duplicates(subset=['protocol', 'timestamp'])
+                    
+                    predictions_df = self.yield_predictor.predict(combined)
+                except Exception as e:
+                    for _, future in members:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                
+                for _, future in members:
+                    if not future.done():
+                        future.set_result(predictions_df)
+    
+    def _with_float32_features(self, 
+                               data: pd.DataFrame,
+                               feature_cols: List[str]) -> pd.DataFrame:
+        """Cast model feature columns to a single float32 block before inference"""
+        
+        cols = [col for col in feature_cols if col in data.columns]
+        if not cols:
+            return data
+        
+        return data.astype(dict.fromkeys(cols, np.float32), copy=False)
+    
     def _adjust_for_risk_profile(self, 
                                allocation: Dict[str, float],
                                risk_profile: str) -> Dict[str, float]:
@@ -333,124 +629,77 @@ class MLService:
         
         multiplier = risk_multipliers.get(risk_profile, 1.0)
         
-        # Adjust allocations (simplified logic)
-        adjusted = {}
-        total = 0
-        
-        for protocol, allocation_pct in allocation.items():
-            if protocol != 'cash':
-                adjusted[protocol] = allocation_pct * multiplier
-                total += adjusted[protocol]
-        
-        # Normalize to 100%
-        if total > 0:
-            for protocol in adjusted:
-                adjusted[protocol] = adjusted[protocol] / total
-        
-        # Add cash position for conservative profiles
-        if risk_profile == 'conservative':
-            cash_allocation = 0.2  # 20% cash
-            for protocol in adjusted:
-                adjusted[protocol] *= (1 - cash_allocation)
+        # Conservative profiles hold a 20% cash position
+        cash_allocation = 0.2 if risk_profile == 'conservative' else 0.0
+        
+        # Adjust allocations (simplified logic), normalized to 100% before the cash share
+        protocols = [protocol for protocol in allocation if protocol != 'cash']
+        values = np.fromiter(
+            (allocation[protocol] for protocol in protocols),
+            dtype=np.float64, count=len(protocols)
+        )
+        adjusted_values = _adjust_allocations(values, multiplier, cash_allocation)
+        
+        adjusted = dict(zip(protocols, adjusted_values.tolist()))
+        if cash_allocation:
             adjusted['cash'] = cash_allocation
         
         return adjusted
     
+    def _protocol_means(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Mean APY and risk score per protocol, in a single pass over the data"""
+        
+        return data.groupby('protocol', sort=False)[['apy', 'risk_score']].mean()
+    
+    def _allocation_weights(self, 
+                            allocation: Dict[str, float],
+                            means: pd.DataFrame) -> np.ndarray:
+        """Align allocation percentages with the rows of the protocol means"""
+        
+        # Cash has 0% APY and 0 risk, and protocols without data contribute nothing
+        weights = pd.Series(
+            {protocol: pct for protocol, pct in allocation.items() if protocol != 'cash'},
+            dtype=float
+        )
+        return weights.reindex(means.index, fill_value=0.0).to_numpy()
+    
     def _calculate_expected_apy(self, 
                               allocation: Dict[str, float],
-                              data: pd.DataFrame) -> float:
+                              means: pd.DataFrame) -> float:
         """Calculate expected portfolio APY"""
         
-        expected_apy = 0.0
-        
-        for protocol, allocation_pct in allocation.items():
-            if protocol == 'cash':
-                continue  # Cash has 0% APY
-            
-            protocol_data = data[data['protocol'] == protocol]
-            if not protocol_data.empty:
-                avg_apy = protocol_data['apy'].mean()
-                expected_apy += allocation_pct * avg_apy
-        
-        return expected_apy
+        weights = self._allocation_weights(allocation, means)
+        return float(weights @ means['apy'].to_numpy())
     
     def _calculate_portfolio_risk(self, 
                                 allocation: Dict[str, float],
-                                data: pd.DataFrame) -> float:
+                                means: pd.DataFrame) -> float:
         """Calculate portfolio risk score"""
         
-        portfolio_risk = 0.0
-        
-        for protocol, allocation_pct in allocation.items():
-            if protocol == 'cash':
-                continue  # Cash has 0 risk
-            
-            protocol_data = data[data['protocol'] == protocol]
-            if not protocol_data.empty:
-                avg_risk = protocol_data['risk_score'].mean()
-                portfolio_risk += allocation_pct * avg_risk
-        
-        return portfolio_risk
+        weights = self._allocation_weights(allocation, means)
+        return float(weights @ means['risk_score'].to_numpy())
     
-    def _calculate_risk_score(self, protocol: str, data: pd.DataFrame) -> float:
-        """Calculate risk score for a protocol"""
+    def _risk_vector(self, protocols: np.ndarray, means: pd.DataFrame) -> np.ndarray:
+        """Risk scores for a sequence of protocols, looked up in the per-protocol means"""
         
-        protocol_data = data[data['protocol'] == protocol]
-        if protocol_data.empty:
-            return 50.0  # Default medium risk
-        
-        return protocol_data['risk_score'].mean()
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry is valid"""
-        
-        if cache_key not in self.prediction_cache:
-            return False
-        
-        cache_entry = self.prediction_cache[cache_key]
-        age = datetime.now() - cache_entry['timestamp']
-        
-        return age.total_seconds() < self.cache_ttl
+        # Protocols without data default to medium risk
+        return means['risk_score'].reindex(protocols).fillna(50.0).to_numpy()
     
-    async def _cache_cleanup(self):
-        """Periodic cache cleanup"""
+    async def _watch_model_files(self):
+        """Reload models once the task worker has saved retrained ones"""
         
         while True:
             try:
-                current_time = datetime.now()
-                expired_keys = []
-                
-                for key, entry in self.prediction_cache.items():
-                    age = current_time - entry['timestamp']
-                    if age.total_seconds() > self.cache_ttl:
-                        expired_keys.append(key)
-                
-                for key in expired_keys:
-                    del self.prediction_cache[key]
+                await asyncio.sleep(self.model_reload_interval)
                 
-                if expired_keys:
-                    logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-                
-                # Wait 5 minutes before next cleanup
-                await asyncio.sleep(300)
+                if await asyncio.to_thread(self._model_files_mtime) > self._models_mtime:
+                    logger.info("Model files changed, reloading models...")
+                    await self._load_models()
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in cache cleanup: {str(e)}")
-                await asyncio.sleep(300)
-    
-    async def _periodic_model_update(self):
-        """Periodic model retraining"""
-        
-        while True:
-            try:
-                # Wait 24 hours between updates
-                await asyncio.sleep(86400)
-                
-                logger.info("Starting periodic model update...")
-                await self.retrain_models()
-                
-            except Exception as e:
-                logger.error(f"Error in periodic model update: {str(e)}")
+                logger.error("Error reloading models: %s", e)
     
     async def retrain_models(self):
         """Retrain ML models with latest data"""
@@ -463,44 +712,57 @@ class MLService:
                 self.model_status[model_name].status = 'training'
             
             # Collect training data
-            async with self.data_collector as collector:
-                training_data = await collector.collect_historical_data(days=90)
+            training_data = await self._get_history(days=90)
             
-            # Engineer features
-            processed_data = self.feature_engineer.engineer_features(
-                training_data, fit=True
-            )
+            # Hand the data to the training process as Parquet files instead of pickling it
+            fd, raw_path = tempfile.mkstemp(suffix='.parquet')
+            os.close(fd)
+            fd, data_path = tempfile.mkstemp(suffix='.parquet')
+            os.close(fd)
             
-            # Retrain yield predictor
-            if self.yield_predictor:
-                yield_results = self.yield_predictor.train(
-                    data=processed_data,
-                    feature_cols=self.feature_engineer.feature_columns,
-                    target_cols=self.feature_engineer.target_columns
+            try:
+                await asyncio.to_thread(pq.write_table, training_data, raw_path)
+                loop = asyncio.get_running_loop()
+                
+                # Fit the feature pipeline in the training process, off the event loop
+                feature_engineer = await loop.run_in_executor(
+                    self._train_executor, _engineer_features_worker, raw_path, data_path
                 )
                 
-                # Save updated model
-                self.yield_predictor.save_model(self.model_paths['yield_predictor'])
+                # Retrain yield predictor
+                if self.yield_predictor:
+                    yield_results = await loop.run_in_executor(
+                        self._train_executor, _train_yield_worker,
+                        data_path, self.model_paths['yield_predictor'],
+                        feature_engineer.feature_columns,
+                        feature_engineer.target_columns
+                    )
+                    
+                    # Serve the retrained weights saved by the training process
+                    self.model_status['yield_predictor'] = await asyncio.to_thread(self._load_yield_sync)
+                    self.model_status['yield_predictor'].accuracy = yield_results.get('val_metrics', {}).get('r2', 0.0)
                 
-                # Update status
-                self.model_status['yield_predictor'].status = 'active'
-                self.model_status['yield_predictor'].last_trained = datetime.now()
-                self.model_status['yield_predictor'].accuracy = yield_results.get('val_metrics', {}).get('r2', 0.0)
-            
-            # Retrain strategy selector
-            if self.strategy_selector:
-                strategy_results = self.strategy_selector.train(
-                    data=processed_data,
-                    episodes=500  # Reduced for periodic updates
+                # Scale inference inputs the way the retrained model saw them
+                self.feature_engineer = feature_engineer
+                self._features_cache.clear()
+                await asyncio.to_thread(
+                    joblib.dump, feature_engineer, self.model_paths['feature_engineer']
                 )
                 
-                # Save updated model
-                self.strategy_selector.save_model(self.model_paths['strategy_selector'])
-                
-                # Update status
-                self.model_status['strategy_selector'].status = 'active'
-                self.model_status['strategy_selector'].last_trained = datetime.now()
-                self.model_status['strategy_selector'].accuracy = strategy_results.get('avg_reward', 0.0)
+                # Retrain strategy selector
+                if self.strategy_selector:
+                    strategy_results = await loop.run_in_executor(
+                        self._train_executor, _train_strategy_worker,
+                        data_path, self.model_paths['strategy_selector'],
+                        500  # Reduced episodes for periodic updates
+                    )
+                    
+                    # Reload what the training process saved rather than assuming it is live
+                    self.model_status['strategy_selector'] = await asyncio.to_thread(self._load_strategy_sync)
+                    self.model_status['strategy_selector'].accuracy = strategy_results.get('avg_reward', 0.0)
+            finally:
+                os.remove(raw_path)
+                os.remove(data_path)
             
             logger.info("Model retraining completed successfully")
             
@@ -511,6 +773,8 @@ class MLService:
             for model_name in self.model_status:
                 self.model_status[model_name].status = 'error'
                 self.model_status[model_name].error_message = str(e)
+            
+            raise
     
     async def collect_training_data(self):
         """Collect new training data"""
@@ -518,12 +782,11 @@ class MLService:
         try:
             logger.info("Collecting training data...")
             
-            async with self.data_collector as collector:
-                new_data = await collector.collect_historical_data(days=7)
-                
-                # Save to training dataset
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                await collector.save_data(new_data, f"training_data_{timestamp}.csv")
+            new_data = await self.data_collector.collect_historical_data(days=7)
+            
+            # Save to training dataset
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            await self.data_collector.save_data(new_data, f"training_data_{timestamp}.csv")
             
             logger.info("Training data collection completed")
             
@@ -538,6 +801,9 @@ class MLService:
     async def get_metrics(self) -> Dict[str, Any]:
         """Get ML service metrics"""
         
+        # Evict expired entries so cache_size only counts live ones
+        self.prediction_cache.expire()
+        
         return {
             'models_loaded': len([
                 status for status in self.model_status.values() 
@@ -566,6 +832,21 @@ class MLService:
         
         # Clear cache
         self.prediction_cache.clear()
+        self._features_cache.clear()
+        
+        # Stop the prediction batcher and the model reload check
+        if self._batch_task:
+            self._batch_task.cancel()
+        if self._reload_task:
+            self._reload_task.cancel()
+        
+        # Stop the training process
+        if self._train_executor:
+            self._train_executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Close the data collector's connection pool
+        if self.data_collector:
+            await self.data_collector.__aexit__(None, None, None)
         
         # Save metrics
         # Cancel background tasks
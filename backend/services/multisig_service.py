@@ -5,32 +5,83 @@ Manages proposal creation, approval workflows, and execution of critical operati
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from enum import Enum
-import json
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+import orjson
+from cachetools import LRUCache
 import hashlib
+import heapq
+import random
+import time
 from web3 import Web3
 from eth_account import Account
 from eth_utils import to_checksum_address
 
 logger = logging.getLogger(__name__)
 
-class ProposalType(Enum):
-    VAULT_DEPLOYMENT = "vault_deployment"
-    STRATEGY_UPDATE = "strategy_update"
-    PARAMETER_CHANGE = "parameter_change"
-    EMERGENCY_ACTION = "emergency_action"
-    FUND_WITHDRAWAL = "fund_withdrawal"
-    UPGRADE_CONTRACT = "upgrade_contract"
+# Multicall3 is deployed at the same address on every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
-class ProposalStatus(Enum):
-    PENDING = "pending"
-    APPROVED = "approved"
-    REJECTED = "rejected"
-    EXECUTED = "executed"
-    EXPIRED = "expired"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+def _json_default(obj: Any) -> Any:
+    """Encode the proposal field types orjson doesn't handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return '0x' + obj.hex()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class ProposalType(IntEnum):
+    VAULT_DEPLOYMENT = 0
+    STRATEGY_UPDATE = 1
+    PARAMETER_CHANGE = 2
+    EMERGENCY_ACTION = 3
+    FUND_WITHDRAWAL = 4
+    UPGRADE_CONTRACT = 5
+
+class ProposalStatus(IntEnum):
+    PENDING = 0
+    APPROVED = 1
+    REJECTED = 2
+    EXECUTED = 3
+    EXPIRED = 4
+
+VOTE_APPROVE = "approve"
+VOTE_REJECT = "reject"
+
+# External (API/JSON) names for the integer enums
+PROPOSAL_TYPE_NAMES = {proposal_type: proposal_type.name.lower() for proposal_type in ProposalType}
+PROPOSAL_STATUS_NAMES = {status: status.name.lower() for status in ProposalStatus}
 
 @dataclass
 class Proposal:
@@ -46,10 +97,19 @@ class Proposal:
     created_at: datetime
     expires_at: datetime
     status: ProposalStatus
-    approvals: List[str]
-    rejections: List[str]
+    approvals: Set[str] = field(default_factory=set)
+    rejections: Set[str] = field(default_factory=set)
+    votes: Dict[str, str] = field(default_factory=dict)  # signer -> current vote
     execution_hash: Optional[str] = None
     executed_at: Optional[datetime] = None
+    expires_at_ts: float = 0.0  # expires_at as a Unix timestamp, for cheap comparisons
+    
+    def to_json(self) -> bytes:
+        """Serialize the proposal to JSON bytes"""
+        data = asdict(self)
+        data['proposal_type'] = PROPOSAL_TYPE_NAMES[self.proposal_type]
+        data['status'] = PROPOSAL_STATUS_NAMES[self.status]
+        return orjson.dumps(data, default=_json_default)
 
 @dataclass
 class Signer:
@@ -60,6 +120,21 @@ class Signer:
     active: bool
     added_at: datetime
 
+# Statuses a proposal never leaves
+TERMINAL_STATUSES = frozenset({ProposalStatus.REJECTED, ProposalStatus.EXECUTED, ProposalStatus.EXPIRED})
+
+class _TerminalProposalCache(LRUCache):
+    """Bounded LRU of decided proposals that reports evictions so indexes can drop them"""
+    
+    def __init__(self, maxsize: int, on_evict):
+        super().__init__(maxsize)
+        self._on_evict = on_evict
+    
+    def popitem(self):
+        key, proposal = super().popitem()
+        self._on_evict(proposal)
+        return key, proposal
+
 class MultisigService:
     """Multi-signature wallet service"""
     
@@ -69,6 +144,12 @@ class MultisigService:
         
         # Load multisig contract
         self.multisig_contract = None
+        self.async_multisig_contract = None
+        self.multicall_contract = None
+        self.async_multicall_contract = None
+        self._multicall_available = True  # Cleared after the first failed Multicall3 read
+        self._fn_submit = None
+        self._sel_deploy_vault = None
         self._load_multisig_contract()
         
         # Configuration
@@ -81,8 +162,22 @@ class MultisigService:
         
         # State
         self.signers: Dict[str, Signer] = {}
-        self.proposals: Dict[str, Proposal] = {}
+        self.proposals: Dict[str, Proposal] = {}  # Live (pending/approved) proposals only
+        self._terminal_cache = _TerminalProposalCache(10_000, self._drop_from_indexes)
         self.proposal_counter = 0
+        self._recompute_thresholds()
+        
+        # Proposal ID indexes, kept in step with every status transition
+        self._by_status: Dict[ProposalStatus, Set[str]] = {status: set() for status in ProposalStatus}
+        self._by_type: Dict[ProposalType, Set[str]] = {proposal_type: set() for proposal_type in ProposalType}
+        
+        # Pending expiries as a (expires_at_ts, proposal_id) min-heap; the event wakes the monitor early
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_wakeup = asyncio.Event()
+        self._monitor_fail_count = 0
+        
+        # Queued executions, submitted one at a time by a single worker
+        self._execute_queue = None
         
         # Load initial state
         asyncio.create_task(self._initialize_state())
@@ -139,58 +234,130 @@ class MultisigService:
                 address=to_checksum_address(self.multisig_address),
                 abi=multisig_abi
             )
+            self.multicall_contract = self.web3_service.w3.eth.contract(
+                address=MULTICALL3_ADDRESS,
+                abi=MULTICALL3_ABI
+            )
+            
+            # Reads go through the async client when the Web3 service provides one;
+            # the sync binding is kept for transaction submission
+            if getattr(self.web3_service, 'async_w3', None):
+                self.async_multisig_contract = self.web3_service.async_w3.eth.contract(
+                    address=to_checksum_address(self.multisig_address),
+                    abi=multisig_abi
+                )
+                self.async_multicall_contract = self.web3_service.async_w3.eth.contract(
+                    address=MULTICALL3_ADDRESS,
+                    abi=MULTICALL3_ABI
+                )
+            
+            # Bind hot-path functions and selectors once
+            self._fn_submit = self.multisig_contract.functions.submitTransaction
+            self._sel_deploy_vault = bytes(
+                self.web3_service.w3.keccak(text="deployVault(address,string,string,uint8,address)")[:4]
+            )
     
     async def _initialize_state(self):
         """Initialize service state"""
         
         try:
-            # Load signers from contract
-            await self._load_signers()
+            # Load signers and configuration from contract
+            await self._load_onchain_state()
             
-            # Load configuration from contract
-            await self._load_config()
-            
-            # Start monitoring
+            # Start monitoring and the execution worker
             asyncio.create_task(self._monitor_proposals())
+            self._execute_queue = asyncio.Queue()
+            asyncio.create_task(self._execution_worker())
             
             logger.info("Multisig service initialized")
             
         except Exception as e:
-            logger.error(f"Failed to initialize multisig service: {str(e)}")
+            logger.error("Failed to initialize multisig service: %s", e)
     
-    async def _load_signers(self):
-        """Load signers from multisig contract"""
+    async def _load_onchain_state(self):
+        """Load signers and configuration from the multisig contract, batched through Multicall3 where available"""
         
         try:
             if self.multisig_contract:
-                owners = self.multisig_contract.functions.getOwners().call()
-                
-                for i, owner in enumerate(owners):
-                    self.signers[owner] = Signer(
-                        address=owner,
-                        name=f"Signer {i+1}",
-                        role="owner",
-                        active=True,
-                        added_at=datetime.now()  # Would get actual date from events
-                    )
+                # Local nodes such as hardhat have no Multicall3; read the contract directly there
+                owners = required = None
+                if self._multicall_available:
+                    try:
+                        owners, required = await self._read_state_multicall()
+                    except Exception as e:
+                        logger.warning("Multicall3 read failed, reading multisig state directly: %s", e)
+                        self._multicall_available = False
+                if owners is None:
+                    owners, required = await self._read_state_direct()
                 
-                logger.info(f"Loaded {len(self.signers)} signers")
+                self._load_signers(owners)
+                self._load_config(required)
         
         except Exception as e:
-            logger.error(f"Failed to load signers: {str(e)}")
+            logger.error("Failed to load multisig state: %s", e)
+    
+    async def _read_state_multicall(self) -> Tuple[List[str], int]:
+        """Read owners and required confirmations from the same block through Multicall3"""
+        
+        target = self.multisig_contract.address
+        calls = [
+            (target, False, self.multisig_contract.encodeABI(fn_name='getOwners')),
+            (target, False, self.multisig_contract.encodeABI(fn_name='required'))
+        ]
+        
+        if self.async_multicall_contract:
+            results = await self.async_multicall_contract.functions.aggregate3(calls).call()
+        else:
+            results = await asyncio.to_thread(
+                self.multicall_contract.functions.aggregate3(calls).call
+            )
+        
+        codec = self.web3_service.w3.codec
+        (owners,) = codec.decode(['address[]'], results[0][1])
+        (required,) = codec.decode(['uint256'], results[1][1])
+        
+        # The ABI decoder yields lowercase addresses; the contract call path checksums them
+        return [to_checksum_address(owner) for owner in owners], required
+    
+    async def _read_state_direct(self) -> Tuple[List[str], int]:
+        """Read owners and required confirmations with one call each"""
+        
+        if self.async_multisig_contract:
+            owners, required = await asyncio.gather(
+                self.async_multisig_contract.functions.getOwners().call(),
+                self.async_multisig_contract.functions.required().call()
+            )
+        else:
+            owners, required = await asyncio.gather(
+                asyncio.to_thread(self.multisig_contract.functions.getOwners().call),
+                asyncio.to_thread(self.multisig_contract.functions.required().call)
+            )
+        
+        return owners, required
+    
+    def _load_signers(self, owners: List[str]):
+        """Load signers from multisig contract owners"""
+        
+        for i, owner in enumerate(owners):
+            self.signers[owner] = Signer(
+                address=owner,
+                name=f"Signer {i+1}",
+                role="owner",
+                active=True,
+                added_at=datetime.now()  # Would get actual date from events
+            )
+        
+        self._recompute_thresholds()
+        
+        logger.info("Loaded %d signers", len(self.signers))
     
-    async def _load_config(self):
+    def _load_config(self, required: int):
         """Load configuration from contract"""
         
-        try:
-            if self.multisig_contract:
-                required = self.multisig_contract.functions.required().call()
-                self.config['required_confirmations'] = required
-                
-                logger.info(f"Required confirmations: {required}")
+        self.config['required_confirmations'] = required
+        self._recompute_thresholds()
         
-        except Exception as e:
-            logger.error(f"Failed to load config: {str(e)}")
+        logger.info("Required confirmations: %d", required)
     
     async def create_proposal(self,
                             title: str,
@@ -207,13 +374,18 @@ class MultisigService:
             raise ValueError("Proposer is not a valid signer")
         
         # Check proposal limits
-        pending_count = len([p for p in self.proposals.values() if p.status == ProposalStatus.PENDING])
-        if pending_count >= self.config['max_pending_proposals']:
+        if len(self._by_status[ProposalStatus.PENDING]) >= self.config['max_pending_proposals']:
             raise ValueError("Maximum pending proposals reached")
         
+        now = datetime.now()
+        
         # Generate proposal ID
         self.proposal_counter += 1
-        proposal_id = f"proposal_{self.proposal_counter}_{int(datetime.now().timestamp())}"
+        proposal_id = hashlib.blake2b(
+            b"prop" + self.proposal_counter.to_bytes(8, 'big')
+            + target_contract.encode() + bytes(function_data),
+            digest_size=12
+        ).hexdigest()
         
         # Set expiry based on type
         if proposal_type == ProposalType.EMERGENCY_ACTION:
@@ -221,7 +393,7 @@ class MultisigService:
         else:
             expiry_hours = self.config['proposal_expiry_hours']
         
-        expires_at = datetime.now() + timedelta(hours=expiry_hours)
+        expires_at = now + timedelta(hours=expiry_hours)
         
         # Create proposal
         proposal = Proposal(
@@ -233,122 +405,161 @@ class MultisigService:
             function_data=function_data,
             value=value,
             proposer=proposer or "system",
-            created_at=datetime.now(),
+            created_at=now,
             expires_at=expires_at,
             status=ProposalStatus.PENDING,
-            approvals=[],
-            rejections=[]
+            expires_at_ts=expires_at.timestamp()
         )
         
         # Store proposal
         self.proposals[proposal_id] = proposal
+        self._by_status[proposal.status].add(proposal_id)
+        self._by_type[proposal_type].add(proposal_id)
         
-        logger.info(f"Created proposal {proposal_id}: {title}")
+        # Schedule expiry; wake the monitor in case this is now the soonest
+        heapq.heappush(self._expiry_heap, (proposal.expires_at_ts, proposal_id))
+        self._expiry_wakeup.set()
+        
+        logger.info("Created proposal %s: %s", proposal_id, title)
         return proposal_id
     
     async def approve_proposal(self, proposal_id: str, signer: str) -> bool:
         """Approve a proposal"""
         
-        if proposal_id not in self.proposals:
+        proposal = self.get_proposal(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal not found")
         
         if signer not in self.signers:
             raise ValueError("Invalid signer")
         
-        proposal = self.proposals[proposal_id]
-        
         # Check proposal status
         if proposal.status != ProposalStatus.PENDING:
             raise ValueError("Proposal is not pending")
         
         # Check expiry
-        if datetime.now() > proposal.expires_at:
-            proposal.status = ProposalStatus.EXPIRED
+        if time.time() > proposal.expires_at_ts:
+            self._set_status(proposal, ProposalStatus.EXPIRED)
             raise ValueError("Proposal has expired")
         
         # Check if already approved/rejected by this signer
-        if signer in proposal.approvals:
+        previous_vote = proposal.votes.get(signer)
+        if previous_vote == VOTE_APPROVE:
             raise ValueError("Already approved by this signer")
         
-        if signer in proposal.rejections:
+        if previous_vote == VOTE_REJECT:
             # Remove from rejections if switching to approval
-            proposal.rejections.remove(signer)
+            proposal.rejections.discard(signer)
         
         # Add approval
-        proposal.approvals.append(signer)
+        proposal.approvals.add(signer)
+        proposal.votes[signer] = VOTE_APPROVE
         
         # Check if enough approvals
         if len(proposal.approvals) >= self.config['required_confirmations']:
-            proposal.status = ProposalStatus.APPROVED
+            self._set_status(proposal, ProposalStatus.APPROVED)
             
             # Auto-execute if possible
             if await self._can_auto_execute(proposal):
                 await self._execute_proposal(proposal)
         
-        logger.info(f"Proposal {proposal_id} approved by {signer} ({len(proposal.approvals)}/{self.config['required_confirmations']})")
+        logger.info(
+            "Proposal %s approved by %s (%d/%d)",
+            proposal_id, signer, len(proposal.approvals), self.config['required_confirmations']
+        )
         return proposal.status == ProposalStatus.APPROVED
     
     async def reject_proposal(self, proposal_id: str, signer: str) -> bool:
         """Reject a proposal"""
         
-        if proposal_id not in self.proposals:
+        proposal = self.get_proposal(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal not found")
         
         if signer not in self.signers:
             raise ValueError("Invalid signer")
         
-        proposal = self.proposals[proposal_id]
-        
         # Check proposal status
         if proposal.status != ProposalStatus.PENDING:
             raise ValueError("Proposal is not pending")
         
         # Check if already rejected/approved by this signer
-        if signer in proposal.rejections:
+        previous_vote = proposal.votes.get(signer)
+        if previous_vote == VOTE_REJECT:
             raise ValueError("Already rejected by this signer")
         
-        if signer in proposal.approvals:
+        if previous_vote == VOTE_APPROVE:
             # Remove from approvals if switching to rejection
-            proposal.approvals.remove(signer)
+            proposal.approvals.discard(signer)
         
         # Add rejection
-        proposal.rejections.append(signer)
+        proposal.rejections.add(signer)
+        proposal.votes[signer] = VOTE_REJECT
         
         # Check if enough rejections to reject proposal
-        max_rejections = len(self.signers) - self.config['required_confirmations'] + 1
-        if len(proposal.rejections) >= max_rejections:
-            proposal.status = ProposalStatus.REJECTED
+        if len(proposal.rejections) >= self._max_rejections:
+            self._set_status(proposal, ProposalStatus.REJECTED)
         
-        logger.info(f"Proposal {proposal_id} rejected by {signer}")
+        logger.info("Proposal %s rejected by %s", proposal_id, signer)
         return proposal.status == ProposalStatus.REJECTED
     
     async def execute_proposal(self, proposal_id: str, executor: str = None) -> str:
         """Execute an approved proposal"""
         
-        if proposal_id not in self.proposals:
+        proposal = self.get_proposal(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal not found")
         
-        proposal = self.proposals[proposal_id]
-        
         # Check if proposal can be executed
         if proposal.status != ProposalStatus.APPROVED:
             raise ValueError("Proposal is not approved")
         
-        if datetime.now() > proposal.expires_at:
-            proposal.status = ProposalStatus.EXPIRED
+        if time.time() > proposal.expires_at_ts:
+            self._set_status(proposal, ProposalStatus.EXPIRED)
             raise ValueError("Proposal has expired")
         
-        return await self._execute_proposal(proposal, executor)
+        if self._execute_queue is None:
+            return await self._execute_proposal(proposal, executor)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._execute_queue.put((proposal, executor, future))
+        return await future
+    
+    async def _execution_worker(self):
+        """Submit queued executions in order, one transaction at a time"""
+        
+        while True:
+            proposal, executor, future = await self._execute_queue.get()
+            if future.done():
+                continue
+            
+            # A repeat request for a proposal that already went through shares its hash
+            if proposal.status == ProposalStatus.EXECUTED:
+                future.set_result(proposal.execution_hash)
+                continue
+            
+            # The caller may be cancelled mid-execution; the worker must outlive it
+            try:
+                tx_hash = await self._execute_proposal(proposal, executor)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                else:
+                    logger.error("Execution of proposal %s failed after its caller left: %s", proposal.id, e)
+                continue
+            
+            if not future.done():
+                future.set_result(tx_hash)
     
     async def _execute_proposal(self, proposal: Proposal, executor: str = None) -> str:
         """Internal proposal execution"""
         
         try:
-            logger.info(f"Executing proposal {proposal.id}: {proposal.title}")
+            logger.info("Executing proposal %s: %s", proposal.id, proposal.title)
             
             # Submit transaction to multisig contract
             if self.multisig_contract:
-                submit_function = self.multisig_contract.functions.submitTransaction(
+                submit_function = self._fn_submit(
                     to_checksum_address(proposal.target_contract),
                     proposal.value,
                     proposal.function_data
@@ -360,9 +571,9 @@ class MultisigService:
                 if result.status:
                     proposal.execution_hash = result.hash
                     proposal.executed_at = datetime.now()
-                    proposal.status = ProposalStatus.EXECUTED
+                    self._set_status(proposal, ProposalStatus.EXECUTED)
                     
-                    logger.info(f"Proposal {proposal.id} executed successfully: {result.hash}")
+                    logger.info("Proposal %s executed successfully: %s", proposal.id, result.hash)
                     return result.hash
                 else:
                     raise Exception("Transaction failed")
@@ -370,9 +581,33 @@ class MultisigService:
                 raise Exception("Multisig contract not available")
         
         except Exception as e:
-            logger.error(f"Failed to execute proposal {proposal.id}: {str(e)}")
+            logger.error("Failed to execute proposal %s: %s", proposal.id, e)
             raise
     
+    def _recompute_thresholds(self):
+        """Recompute vote thresholds; call whenever signers or required confirmations change"""
+        
+        # Once this many signers reject, the proposal can no longer reach the required approvals
+        self._max_rejections = len(self.signers) - self.config['required_confirmations'] + 1
+    
+    def _set_status(self, proposal: Proposal, new_status: ProposalStatus):
+        """Transition a proposal's status and keep the status index in sync"""
+        
+        self._by_status[proposal.status].discard(proposal.id)
+        self._by_status[new_status].add(proposal.id)
+        proposal.status = new_status
+        
+        # Decided proposals leave the live dict for the bounded terminal cache
+        if new_status in TERMINAL_STATUSES:
+            self.proposals.pop(proposal.id, None)
+            self._terminal_cache[proposal.id] = proposal
+    
+    def _drop_from_indexes(self, proposal: Proposal):
+        """Remove an evicted proposal from the status and type indexes"""
+        
+        self._by_status[proposal.status].discard(proposal.id)
+        self._by_type[proposal.proposal_type].discard(proposal.id)
+    
     async def _can_auto_execute(self, proposal: Proposal) -> bool:
         """Check if proposal can be auto-executed"""
         
@@ -388,23 +623,39 @@ class MultisigService:
         
         while True:
             try:
-                current_time = datetime.now()
+                now_ts = time.time()
+                
+                # Expire everything that is due; entries for decided proposals are just dropped
+                while self._expiry_heap and self._expiry_heap[0][0] < now_ts:
+                    _, proposal_id = heapq.heappop(self._expiry_heap)
+                    proposal = self.proposals.get(proposal_id)
+                    if proposal and proposal.status == ProposalStatus.PENDING:
+                        self._set_status(proposal, ProposalStatus.EXPIRED)
+                        logger.info("Proposal %s expired", proposal.id)
                 
-                for proposal in self.proposals.values():
-                    if proposal.status == ProposalStatus.PENDING and current_time > proposal.expires_at:
-                        proposal.status = ProposalStatus.EXPIRED
-                        logger.info(f"Proposal {proposal.id} expired")
+                self._monitor_fail_count = 0
                 
-                # Wait 1 minute before next check
-                await asyncio.sleep(60)
+                # Sleep until the next expiry, or until a new proposal is scheduled
+                self._expiry_wakeup.clear()
+                timeout = self._expiry_heap[0][0] - now_ts if self._expiry_heap else None
+                try:
+                    await asyncio.wait_for(self._expiry_wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
-                logger.error(f"Error in proposal monitoring: {str(e)}")
-                await asyncio.sleep(60)
+                logger.error("Error in proposal monitoring: %s", e)
+                
+                # Exponential backoff with full jitter, capped at a minute
+                await asyncio.sleep(random.uniform(0, min(60, 0.5 * 2 ** self._monitor_fail_count)))
+                self._monitor_fail_count = min(self._monitor_fail_count + 1, 10)
     
     def get_proposal(self, proposal_id: str) -> Optional[Proposal]:
         """Get a specific proposal"""
-        return self.proposals.get(proposal_id)
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
+            proposal = self._terminal_cache.get(proposal_id)
+        return proposal
     
     def get_proposals(self, 
                      status: Optional[ProposalStatus] = None,
@@ -412,20 +663,21 @@ class MultisigService:
                      limit: int = 100) -> List[Proposal]:
         """Get proposals with optional filtering"""
         
-        proposals = list(self.proposals.values())
-        
-        # Filter by status
-        if status:
-            proposals = [p for p in proposals if p.status == status]
-        
-        # Filter by type
-        if proposal_type:
-            proposals = [p for p in proposals if p.proposal_type == proposal_type]
+        # Filter by status and type through the indexes; PENDING and
+        # VAULT_DEPLOYMENT are 0, so test against None rather than truthiness
+        if status is not None and proposal_type is not None:
+            proposal_ids = self._by_status[status] & self._by_type[proposal_type]
+        elif status is not None:
+            proposal_ids = self._by_status[status]
+        elif proposal_type is not None:
+            proposal_ids = self._by_type[proposal_type]
+        else:
+            proposal_ids = list(self.proposals.keys()) + list(self._terminal_cache.keys())
         
-        # Sort by creation date (newest first)
-        proposals.sort(key=lambda x: x.created_at, reverse=True)
+        proposals = (self.get_proposal(proposal_id) for proposal_id in proposal_ids)
         
-        return proposals[:limit]
+        # Newest first; a bounded heap avoids sorting proposals past the limit
+        return heapq.nlargest(limit, proposals, key=lambda x: x.created_at)
     
     def get_pending_proposals(self) -> List[Proposal]:
         """Get all pending proposals"""
@@ -442,13 +694,10 @@ class MultisigService:
     def get_proposal_status_summary(self) -> Dict[str, int]:
         """Get summary of proposal statuses"""
         
-        summary = {}
-        for status in ProposalStatus:
-            summary[status.value] = len([
-                p for p in self.proposals.values() if p.status == status
-            ])
-        
-        return summary
+        return {
+            PROPOSAL_STATUS_NAMES[status]: len(proposal_ids)
+            for status, proposal_ids in self._by_status.items()
+        }
     
     async def create_emergency_proposal(self,
                                       title: str,
@@ -475,7 +724,7 @@ class MultisigService:
         """Create a vault deployment proposal"""
         
         # Encode function data for vault deployment
-        function_data = self.web3_service.w3.keccak(text="deployVault(address,string,string,uint8,address)")[:4]
+        function_data = self._sel_deploy_vault
         # Would properly encode parameters
         
         return await self.create_proposal(
@@ -494,8 +743,8 @@ class MultisigService:
             'total_signers': len(self.signers),
             'active_signers': len([s for s in self.signers.values() if s.active]),
             'required_confirmations': self.config['required_confirmations'],
-            'total_proposals': len(self.proposals),
-            'pending_proposals': len(self.get_pending_proposals()),
+            'total_proposals': len(self.proposals) + len(self._terminal_cache),
+            'pending_proposals': len(self._by_status[ProposalStatus.PENDING]),
             'proposal_status_summary': self.get_proposal_status_summary(),
             'multisig_address': self.multisig_address
         }
@@ -7,30 +7,102 @@ import asyncio
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from enum import Enum
-import json
+from enum import Enum, IntEnum
+from collections import Counter, OrderedDict, deque
+import orjson
+import math
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _annualized_vol(prices: np.ndarray) -> float:
+        """Annualized volatility of simple returns in one Welford pass"""
+        
+        mean = 0.0
+        m2 = 0.0
+        count = 0
+        last = math.nan
+        for i in range(prices.shape[0]):
+            # Gaps repeat the last price, as pct_change()'s default pad fill did
+            price = prices[i]
+            if math.isnan(price):
+                price = last
+            prev = last
+            last = price
+            if math.isnan(prev):  # Leading gaps have no return, as dropna() removed
+                continue
+            r = price / prev - 1.0
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+        
+        if count < 2:
+            return math.nan
+        return math.sqrt(m2 / (count - 1)) * math.sqrt(365.0)
+
+except ImportError:  # Same statistic with NumPy when numba is unavailable
+    def _annualized_vol(prices: np.ndarray) -> float:
+        """Annualized volatility of simple returns"""
+        
+        # Forward-fill gaps, as pct_change()'s default pad fill did
+        idx = np.where(np.isnan(prices), 0, np.arange(prices.shape[0]))
+        np.maximum.accumulate(idx, out=idx)
+        prices = prices[idx]
+        
+        returns = prices[1:] / prices[:-1] - 1.0
+        returns = returns[~np.isnan(returns)]
+        if returns.size < 2:
+            return math.nan
+        return float(returns.std(ddof=1) * math.sqrt(365.0))
+
 class RiskLevel(Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
-class RiskCategory(Enum):
-    MARKET = "market"
-    LIQUIDITY = "liquidity"
-    SMART_CONTRACT = "smart_contract"
-    PROTOCOL = "protocol"
-    OPERATIONAL = "operational"
-    REGULATORY = "regulatory"
+class RiskCategory(IntEnum):
+    """Risk categories; values double as array slots in score aggregation"""
+    MARKET = 0
+    LIQUIDITY = 1
+    SMART_CONTRACT = 2
+    PROTOCOL = 3
+    OPERATIONAL = 4
+    REGULATORY = 5
+
+RISK_CATEGORY_NAMES = {category: category.name.lower() for category in RiskCategory}
+
+# Levels that raise alerts and category recommendations
+HIGH_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+# Mitigation advice per high-risk metric category
+CATEGORY_RECO_TEMPLATES = {
+    RiskCategory.LIQUIDITY: "Monitor {name} closely - consider reducing allocation",
+    RiskCategory.SMART_CONTRACT: "Review {name} - additional due diligence required",
+    RiskCategory.MARKET: "High {name} detected - implement stop-loss mechanisms",
+    RiskCategory.PROTOCOL: "{name} concern - diversify across protocols"
+}
+
+# Advice for the overall assessment level
+OVERALL_RECO = {
+    RiskLevel.CRITICAL: "CRITICAL RISK: Consider immediate position reduction or exit",
+    RiskLevel.HIGH: "HIGH RISK: Reduce position size and increase monitoring frequency",
+    RiskLevel.MEDIUM: "MEDIUM RISK: Maintain current allocation with regular monitoring"
+}
+
+# Category weights indexed by RiskCategory value (regulatory keeps the 0.1 fallback weight)
+CATEGORY_W = np.array([0.25, 0.20, 0.25, 0.20, 0.10, 0.10])
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskMetric:
     """Individual risk metric"""
     name: str
@@ -41,7 +113,7 @@ class RiskMetric:
     description: str
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskAssessment:
     """Comprehensive risk assessment"""
     protocol: str
@@ -51,7 +123,7 @@ class RiskAssessment:
     recommendations: List[str]
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class RiskAlert:
     """Risk alert notification"""
     id: str
@@ -64,6 +136,29 @@ class RiskAlert:
     timestamp: datetime
     acknowledged: bool = False
 
+def _serialize_assessment(assessment: RiskAssessment) -> bytes:
+    """Encode an assessment as JSON for broadcast, naming categories instead of their slots"""
+    
+    return orjson.dumps({
+        'protocol': assessment.protocol,
+        'overall_score': assessment.overall_score,
+        'overall_level': assessment.overall_level,
+        'metrics': [
+            {
+                'name': m.name,
+                'category': RISK_CATEGORY_NAMES[m.category],
+                'value': m.value,
+                'threshold': m.threshold,
+                'level': m.level,
+                'description': m.description,
+                'timestamp': m.timestamp
+            }
+            for m in assessment.metrics
+        ],
+        'recommendations': assessment.recommendations,
+        'timestamp': assessment.timestamp
+    }, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+
 class RiskService:
     """Comprehensive risk assessment and management service"""
     
@@ -82,18 +177,40 @@ class RiskService:
             RiskLevel.CRITICAL: 90
         }
         
-        # Active alerts
-        self.active_alerts: Dict[str, RiskAlert] = {}
-        
-        # Risk history
-        self.risk_history: List[RiskAssessment] = []
+        # Level boundaries as a sorted vector: scores below LOW are low, at or
+        # above HIGH are critical
+        self._thr_arr = np.array([
+            self.thresholds[RiskLevel.LOW],
+            self.thresholds[RiskLevel.MEDIUM],
+            self.thresholds[RiskLevel.HIGH]
+        ], dtype=np.float64)
+        self._thr_levels = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+        
+        # Active alerts, oldest first; capped at a day's worth of the hourly alert budget
+        self.active_alerts: OrderedDict[str, RiskAlert] = OrderedDict()
+        self.max_active_alerts = self.risk_config["monitoring"]["max_alerts_per_hour"] * 24
+        
+        # Risk history, bounded overall and per protocol
+        self.risk_history: deque = deque(maxlen=10000)
+        self._history_by_protocol: Dict[str, deque] = {}
+        self.max_history_per_protocol = 2000
+        self._last_assessment_ts: Optional[datetime] = None
         
         # Monitoring state
         self.monitoring_active = False
         
+        # Rolling volatility window per protocol, updated with new bars only
+        self.volatility_window = timedelta(days=30)
+        self._vol_state: Dict[str, Dict[str, Any]] = {}
+        
+        # Monitoring cycles above this many protocols score liquidity in one batch
+        self.liquidity_batch_threshold = 10
+        
         # Risk metrics cache
-        self.metrics_cache = {}
+        self.metrics_cache: Dict[Tuple, Tuple[Any, float]] = {}
         self.cache_ttl = 300  # 5 minutes
+        self.static_cache_ttl = 86400  # Contract info rarely changes
+        self._cache_locks: Dict[Tuple, asyncio.Lock] = {}
     
     def _load_risk_config(self) -> Dict[str, Any]:
         """Load risk assessment configuration"""
@@ -132,8 +249,8 @@ class RiskService:
         
         config_path = "backend/config/risk_config.json"
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                loaded_config = json.load(f)
+            with open(config_path, 'rb') as f:
+                loaded_config = orjson.loads(f.read())
                 # Merge with defaults
                 for key, value in loaded_config.items():
                     if key in default_config:
@@ -143,34 +260,37 @@ class RiskService:
         
         return default_config
     
-    async def assess_protocol_risk(self, protocol: str) -> RiskAssessment:
+    async def assess_protocol_risk(self,
+                                   protocol: str,
+                                   liquidity_metrics: Optional[List[RiskMetric]] = None) -> RiskAssessment:
         """Perform comprehensive risk assessment for a protocol"""
         
-        logger.info(f"Assessing risk for protocol: {protocol}")
+        logger.info("Assessing risk for protocol: %s", protocol)
         
         try:
-            # Collect risk metrics
-            metrics = []
+            # One timestamp shared by every metric in this assessment
+            now = datetime.now()
             
-            # Market risk metrics
-            market_metrics = await self._assess_market_risk(protocol)
-            metrics.extend(market_metrics)
+            # Collect risk metrics from all categories concurrently
+            assessors = [
+                self._assess_market_risk(protocol, now),
+                self._assess_smart_contract_risk(protocol, now),
+                self._assess_protocol_risk_metrics(protocol, now),
+                self._assess_operational_risk(protocol, now)
+            ]
             
-            # Liquidity risk metrics
-            liquidity_metrics = await self._assess_liquidity_risk(protocol)
-            metrics.extend(liquidity_metrics)
+            # Liquidity metrics may already have been computed for a batch of protocols
+            if liquidity_metrics is None:
+                assessors.insert(1, self._assess_liquidity_risk(protocol, now))
             
-            # Smart contract risk metrics
-            contract_metrics = await self._assess_smart_contract_risk(protocol)
-            metrics.extend(contract_metrics)
+            results = await asyncio.gather(*assessors, return_exceptions=True)
             
-            # Protocol risk metrics
-            protocol_metrics = await self._assess_protocol_risk_metrics(protocol)
-            metrics.extend(protocol_metrics)
-            
-            # Operational risk metrics
-            operational_metrics = await self._assess_operational_risk(protocol)
-            metrics.extend(operational_metrics)
+            metrics = [] if liquidity_metrics is None else list(liquidity_metrics)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("Risk metric collection failed for %s: %s", protocol, result)
+                    continue
+                metrics.extend(result)
             
             # Calculate overall risk score
             overall_score = self._calculate_overall_risk_score(metrics)
@@ -186,49 +306,59 @@ class RiskService:
                 overall_level=overall_level,
                 metrics=metrics,
                 recommendations=recommendations,
-                timestamp=datetime.now()
+                timestamp=now
             )
             
             # Store in history
             self.risk_history.append(assessment)
+            protocol_history = self._history_by_protocol.get(protocol)
+            if protocol_history is None:
+                protocol_history = self._history_by_protocol[protocol] = deque(
+                    maxlen=self.max_history_per_protocol
+                )
+            protocol_history.append(assessment)
+            self._last_assessment_ts = assessment.timestamp
             
             # Check for alerts
             await self._check_risk_alerts(assessment)
             
-            logger.info(f"Risk assessment completed for {protocol}: {overall_level.value} ({overall_score:.2f})")
+            logger.info("Risk assessment completed for %s: %s (%.2f)", protocol, overall_level.value, overall_score)
             return assessment
             
         except Exception as e:
-            logger.error(f"Risk assessment failed for {protocol}: {str(e)}")
+            logger.error("Risk assessment failed for %s: %s", protocol, e)
             raise
     
-    async def _assess_market_risk(self, protocol: str) -> List[RiskMetric]:
+    async def _assess_market_risk(self, protocol: str, now: datetime) -> List[RiskMetric]:
         """Assess market-related risks"""
         
         metrics = []
+        cfg = self.risk_config["market_risk"]
         
         try:
             # Get historical price data
-            price_data = await self._get_price_data(protocol, days=30)
+            price_data = await self._cached(
+                ('price', protocol, self.volatility_window.days), self.cache_ttl,
+                lambda: self._get_price_data(protocol, days=self.volatility_window.days)
+            )
             
-            if not price_data.empty:
+            if price_data is not None and not price_data.empty:
                 # Volatility
-                returns = price_data['price'].pct_change().dropna()
-                volatility = returns.std() * np.sqrt(365)  # Annualized
+                volatility = self._update_vol_state(protocol, price_data)  # Annualized
                 
                 metrics.append(RiskMetric(
                     name="Price Volatility",
                     category=RiskCategory.MARKET,
                     value=volatility,
-                    threshold=self.risk_config["market_risk"]["volatility_threshold"],
+                    threshold=cfg["volatility_threshold"],
                     level=self._get_risk_level(volatility * 100),
                     description=f"Annualized price volatility: {volatility:.2%}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
                 
                 # Liquidity depth
                 avg_liquidity = price_data['liquidity'].mean()
-                liquidity_threshold = self.risk_config["market_risk"]["liquidity_threshold"]
+                liquidity_threshold = cfg["liquidity_threshold"]
                 
                 liquidity_score = min(100, (avg_liquidity / liquidity_threshold) * 100)
                 
@@ -239,22 +369,82 @@ class RiskService:
                     threshold=50,
                     level=self._get_risk_level(100 - liquidity_score),
                     description=f"Average liquidity: ${avg_liquidity:,.0f}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         except Exception as e:
-            logger.error(f"Market risk assessment failed: {str(e)}")
+            logger.error("Market risk assessment failed: %s", e)
         
         return metrics
     
-    async def _assess_liquidity_risk(self, protocol: str) -> List[RiskMetric]:
+    def _update_vol_state(self, protocol: str, price_data: pd.DataFrame) -> float:
+        """Fold new price bars into the protocol's rolling volatility window"""
+        
+        # Without bar timestamps there is no way to tell new bars from old ones
+        if 'timestamp' not in price_data:
+            return _annualized_vol(price_data['price'].to_numpy(dtype=np.float64))
+        
+        state = self._vol_state.get(protocol)
+        if state is None:
+            state = self._vol_state[protocol] = {
+                'sum': 0.0, 'sum_sq': 0.0, 'n': 0,
+                'last_ts': None, 'last_price': None, 'buf': deque()
+            }
+        
+        bars = price_data[['timestamp', 'price']].assign(
+            timestamp=pd.to_datetime(price_data['timestamp'])
+        ).sort_values('timestamp')
+        if state['last_ts'] is not None:
+            bars = bars[bars['timestamp'] > state['last_ts']]
+        
+        buf = state['buf']
+        total, total_sq, n = state['sum'], state['sum_sq'], state['n']
+        prev = state['last_price']
+        
+        # Add returns for bars that arrived since the last update
+        for ts, price in zip(bars['timestamp'], bars['price']):
+            # Gaps repeat the last price, as in _annualized_vol
+            if math.isnan(price) and prev is not None:
+                price = prev
+            if prev is not None:
+                r = price / prev - 1.0
+                if not math.isnan(r):
+                    buf.append((ts, r))
+                    total += r
+                    total_sq += r * r
+                    n += 1
+            prev = price
+            state['last_ts'] = ts
+        state['last_price'] = prev
+        
+        # Drop returns that have slid out of the window
+        if state['last_ts'] is not None:
+            cutoff = state['last_ts'] - self.volatility_window
+            while buf and buf[0][0] < cutoff:
+                _, r = buf.popleft()
+                total -= r
+                total_sq -= r * r
+                n -= 1
+        
+        state['sum'], state['sum_sq'], state['n'] = total, total_sq, n
+        
+        if n < 2:
+            return math.nan
+        variance = max(0.0, (total_sq - total * total / n) / (n - 1))
+        return math.sqrt(variance) * math.sqrt(365.0)
+    
+    async def _assess_liquidity_risk(self, protocol: str, now: datetime) -> List[RiskMetric]:
         """Assess liquidity-related risks"""
         
         metrics = []
         
         try:
             # Get protocol liquidity data
-            liquidity_data = await self._get_liquidity_data(protocol)
+            liquidity_data = await self._cached(
+                ('liquidity', protocol), self.cache_ttl, lambda: self._get_liquidity_data(protocol)
+            )
+            if not liquidity_data:
+                return metrics
             
             # Utilization rate
             if 'utilization_rate' in liquidity_data:
@@ -267,7 +457,7 @@ class RiskService:
                     threshold=80,  # 80% utilization threshold
                     level=self._get_risk_level(utilization * 100),
                     description=f"Protocol utilization: {utilization:.1%}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Withdrawal capacity
@@ -281,27 +471,86 @@ class RiskService:
                     threshold=20,  # 20% minimum capacity
                     level=self._get_risk_level((1 - withdrawal_capacity) * 100),
                     description=f"Available for withdrawal: {withdrawal_capacity:.1%}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         except Exception as e:
-            logger.error(f"Liquidity risk assessment failed: {str(e)}")
+            logger.error("Liquidity risk assessment failed: %s", e)
         
         return metrics
     
-    async def _assess_smart_contract_risk(self, protocol: str) -> List[RiskMetric]:
+    async def _assess_liquidity_risk_batch(self,
+                                           protocols: List[str],
+                                           now: datetime) -> Dict[str, List[RiskMetric]]:
+        """Assess liquidity-related risks for many protocols in one vectorized pass"""
+        
+        metrics = {protocol: [] for protocol in protocols}
+        
+        try:
+            liquidity_data = await self._get_liquidity_data_batch(protocols)
+            
+            # Utilization rate
+            if 'utilization_rate' in liquidity_data:
+                rows = liquidity_data[liquidity_data['utilization_rate'].notna()]
+                util_risk = rows.eval("utilization_rate * 100").to_numpy(dtype=np.float64)
+                
+                for protocol, utilization, value, level in zip(
+                    rows.index, rows['utilization_rate'], util_risk, self._get_risk_levels_bulk(util_risk)
+                ):
+                    metrics[protocol].append(RiskMetric(
+                        name="Utilization Rate",
+                        category=RiskCategory.LIQUIDITY,
+                        value=float(value),
+                        threshold=80,  # 80% utilization threshold
+                        level=level,
+                        description=f"Protocol utilization: {utilization:.1%}",
+                        timestamp=now
+                    ))
+            
+            # Withdrawal capacity
+            if 'available_liquidity' in liquidity_data and 'total_deposits' in liquidity_data:
+                rows = liquidity_data[
+                    liquidity_data['available_liquidity'].notna() & liquidity_data['total_deposits'].notna()
+                ]
+                capacity = rows.eval("available_liquidity / total_deposits").to_numpy(dtype=np.float64)
+                wd_risk = (1 - capacity) * 100  # Invert so lower capacity = higher risk
+                
+                for protocol, withdrawal_capacity, value, level in zip(
+                    rows.index, capacity, wd_risk, self._get_risk_levels_bulk(wd_risk)
+                ):
+                    metrics[protocol].append(RiskMetric(
+                        name="Withdrawal Capacity",
+                        category=RiskCategory.LIQUIDITY,
+                        value=float(value),
+                        threshold=20,  # 20% minimum capacity
+                        level=level,
+                        description=f"Available for withdrawal: {withdrawal_capacity:.1%}",
+                        timestamp=now
+                    ))
+        
+        except Exception as e:
+            logger.error("Batch liquidity risk assessment failed: %s", e)
+        
+        return metrics
+    
+    async def _assess_smart_contract_risk(self, protocol: str, now: datetime) -> List[RiskMetric]:
         """Assess smart contract risks"""
         
         metrics = []
+        cfg = self.risk_config["protocol_risk"]
         
         try:
             # Get contract information
-            contract_info = await self._get_contract_info(protocol)
+            contract_info = await self._cached(
+                ('contract', protocol), self.static_cache_ttl, lambda: self._get_contract_info(protocol)
+            )
+            if not contract_info:
+                return metrics
             
             # Contract age
             if 'deployment_date' in contract_info:
-                age_days = (datetime.now() - contract_info['deployment_date']).days
-                age_threshold = self.risk_config["protocol_risk"]["age_threshold"]
+                age_days = (now - contract_info['deployment_date']).days
+                age_threshold = cfg["age_threshold"]
                 
                 age_score = min(100, (age_days / age_threshold) * 100)
                 
@@ -312,7 +561,7 @@ class RiskService:
                     threshold=50,
                     level=self._get_risk_level(100 - age_score),
                     description=f"Contract deployed {age_days} days ago",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Audit status
@@ -326,7 +575,7 @@ class RiskService:
                     threshold=30,
                     level=self._get_risk_level(100 - audit_score),
                     description=f"Audit score: {audit_score}/100",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Upgrade mechanism
@@ -340,27 +589,32 @@ class RiskService:
                     threshold=30,
                     level=self._get_risk_level(upgrade_risk),
                     description="Contract is upgradeable" if contract_info['is_upgradeable'] else "Contract is immutable",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         except Exception as e:
-            logger.error(f"Smart contract risk assessment failed: {str(e)}")
+            logger.error("Smart contract risk assessment failed: %s", e)
         
         return metrics
     
-    async def _assess_protocol_risk_metrics(self, protocol: str) -> List[RiskMetric]:
+    async def _assess_protocol_risk_metrics(self, protocol: str, now: datetime) -> List[RiskMetric]:
         """Assess protocol-specific risks"""
         
         metrics = []
+        cfg = self.risk_config["protocol_risk"]
         
         try:
             # Get protocol data
-            protocol_data = await self._get_protocol_data(protocol)
+            protocol_data = await self._cached(
+                ('protocol', protocol), self.cache_ttl, lambda: self._get_protocol_data(protocol)
+            )
+            if not protocol_data:
+                return metrics
             
             # TVL risk
             if 'tvl' in protocol_data:
                 tvl = protocol_data['tvl']
-                tvl_threshold = self.risk_config["protocol_risk"]["tvl_threshold"]
+                tvl_threshold = cfg["tvl_threshold"]
                 
                 tvl_score = min(100, (tvl / tvl_threshold) * 100)
                 
@@ -371,7 +625,7 @@ class RiskService:
                     threshold=50,
                     level=self._get_risk_level(100 - tvl_score),
                     description=f"Total Value Locked: ${tvl:,.0f}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Governance risk
@@ -385,7 +639,7 @@ class RiskService:
                     threshold=30,
                     level=self._get_risk_level(100 - governance_score),
                     description=f"Governance score: {governance_score}/100",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Concentration risk
@@ -399,22 +653,27 @@ class RiskService:
                     threshold=30,  # 30% concentration threshold
                     level=self._get_risk_level(concentration),
                     description=f"Top depositor holds {concentration:.1f}% of funds",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         except Exception as e:
-            logger.error(f"Protocol risk assessment failed: {str(e)}")
+            logger.error("Protocol risk assessment failed: %s", e)
         
         return metrics
     
-    async def _assess_operational_risk(self, protocol: str) -> List[RiskMetric]:
+    async def _assess_operational_risk(self, protocol: str, now: datetime) -> List[RiskMetric]:
         """Assess operational risks"""
         
         metrics = []
+        cfg = self.risk_config["operational_risk"]
         
         try:
             # Get operational data
-            operational_data = await self._get_operational_data(protocol)
+            operational_data = await self._cached(
+                ('operational', protocol), self.cache_ttl, lambda: self._get_operational_data(protocol)
+            )
+            if not operational_data:
+                return metrics
             
             # Team risk
             if 'team_score' in operational_data:
@@ -427,13 +686,13 @@ class RiskService:
                     threshold=30,
                     level=self._get_risk_level(100 - team_score),
                     description=f"Team credibility score: {team_score}/100",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
             
             # Multisig risk
             if 'multisig_threshold' in operational_data:
                 multisig_threshold = operational_data['multisig_threshold']
-                required_threshold = self.risk_config["operational_risk"]["multisig_threshold"]
+                required_threshold = cfg["multisig_threshold"]
                 
                 multisig_risk = max(0, (required_threshold - multisig_threshold) * 20)
                 
@@ -444,11 +703,11 @@ class RiskService:
                     threshold=40,
                     level=self._get_risk_level(multisig_risk),
                     description=f"Multisig threshold: {multisig_threshold}/{operational_data.get('multisig_total', 'N/A')}",
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         
         except Exception as e:
-            logger.error(f"Operational risk assessment failed: {str(e)}")
+            logger.error("Operational risk assessment failed: %s", e)
         
         return metrics
     
@@ -458,51 +717,30 @@ class RiskService:
         if not metrics:
             return 50.0  # Default medium risk
         
-        # Weight metrics by category
-        category_weights = {
-            RiskCategory.MARKET: 0.25,
-            RiskCategory.LIQUIDITY: 0.20,
-            RiskCategory.SMART_CONTRACT: 0.25,
-            RiskCategory.PROTOCOL: 0.20,
-            RiskCategory.OPERATIONAL: 0.10
-        }
-        
-        category_scores = {}
-        category_counts = {}
+        # Group metric values by category in one pass
+        n = len(metrics)
+        ids = np.fromiter((m.category for m in metrics), dtype=np.intp, count=n)
+        vals = np.fromiter((m.value for m in metrics), dtype=np.float64, count=n)
         
-        # Group metrics by category
-        for metric in metrics:
-            if metric.category not in category_scores:
-                category_scores[metric.category] = 0
-                category_counts[metric.category] = 0
-            
-            category_scores[metric.category] += metric.value
-            category_counts[metric.category] += 1
+        sums = np.bincount(ids, weights=vals, minlength=len(CATEGORY_W))
+        counts = np.bincount(ids, minlength=len(CATEGORY_W))
         
-        # Calculate weighted average
-        total_score = 0
-        total_weight = 0
+        # Weighted average over the categories that have metrics
+        present = counts > 0
+        avg = np.divide(sums, counts, out=np.zeros_like(sums), where=present)
+        weights = CATEGORY_W * present
+        total_weight = weights.sum()
         
-        for category, score in category_scores.items():
-            if category_counts[category] > 0:
-                avg_score = score / category_counts[category]
-                weight = category_weights.get(category, 0.1)
-                total_score += avg_score * weight
-                total_weight += weight
-        
-        return total_score / total_weight if total_weight > 0 else 50.0
+        return float(avg @ weights / total_weight) if total_weight > 0 else 50.0
     
     def _get_risk_level(self, score: float) -> RiskLevel:
         """Convert risk score to risk level"""
-        
-        if score < self.thresholds[RiskLevel.LOW]:
-            return RiskLevel.LOW
-        elif score < self.thresholds[RiskLevel.MEDIUM]:
-            return RiskLevel.MEDIUM
-        elif score < self.thresholds[RiskLevel.HIGH]:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.CRITICAL
+        return self._thr_levels[int(np.searchsorted(self._thr_arr, score, side='right'))]
+    
+    def _get_risk_levels_bulk(self, scores: np.ndarray) -> List[RiskLevel]:
+        """Convert an array of risk scores to risk levels in one call"""
+        indices = np.searchsorted(self._thr_arr, scores, side='right')
+        return [self._thr_levels[i] for i in indices.tolist()]
     
     def _generate_risk_recommendations(self, 
                                      metrics: List[RiskMetric], 
@@ -512,34 +750,28 @@ class RiskService:
         recommendations = []
         
         # High-risk metrics
-        high_risk_metrics = [m for m in metrics if m.level in [RiskLevel.HIGH, RiskLevel.CRITICAL]]
+        high_risk_metrics = [m for m in metrics if m.level in HIGH_RISK_LEVELS]
         
         for metric in high_risk_metrics:
-            if metric.category == RiskCategory.LIQUIDITY:
-                recommendations.append(f"Monitor {metric.name} closely - consider reducing allocation")
-            elif metric.category == RiskCategory.SMART_CONTRACT:
-                recommendations.append(f"Review {metric.name} - additional due diligence required")
-            elif metric.category == RiskCategory.MARKET:
-                recommendations.append(f"High {metric.name} detected - implement stop-loss mechanisms")
-            elif metric.category == RiskCategory.PROTOCOL:
-                recommendations.append(f"{metric.name} concern - diversify across protocols")
+            template = CATEGORY_RECO_TEMPLATES.get(metric.category)
+            if template:
+                recommendations.append(template.format(name=metric.name))
         
         # Overall level recommendations
-        if overall_level == RiskLevel.CRITICAL:
-            recommendations.append("CRITICAL RISK: Consider immediate position reduction or exit")
-        elif overall_level == RiskLevel.HIGH:
-            recommendations.append("HIGH RISK: Reduce position size and increase monitoring frequency")
-        elif overall_level == RiskLevel.MEDIUM:
-            recommendations.append("MEDIUM RISK: Maintain current allocation with regular monitoring")
+        overall = OVERALL_RECO.get(overall_level)
+        if overall:
+            recommendations.append(overall)
         
         return recommendations
     
     async def _check_risk_alerts(self, assessment: RiskAssessment):
         """Check for risk alerts and create notifications"""
         
+        alert_ts = int(assessment.timestamp.timestamp())
+        
         for metric in assessment.metrics:
-            if metric.level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-                alert_id = f"{assessment.protocol}_{metric.name}_{int(datetime.now().timestamp())}"
+            if metric.level in HIGH_RISK_LEVELS:
+                alert_id = f"{assessment.protocol}_{metric.name}_{alert_ts}"
                 
                 alert = RiskAlert(
                     id=alert_id,
@@ -549,37 +781,65 @@ class RiskService:
                     message=f"{metric.name} exceeded threshold: {metric.value:.2f} > {metric.threshold}",
                     metric_value=metric.value,
                     threshold=metric.threshold,
-                    timestamp=datetime.now()
+                    timestamp=assessment.timestamp
                 )
                 
-                self.active_alerts[alert_id] = alert
-                logger.warning(f"Risk alert created: {alert.message}")
+                self._add_alert(alert)
+                logger.warning("Risk alert created: %s", alert.message)
+    
+    async def _cached(self, key: Tuple, ttl: float, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached fetch result, refreshing it once the TTL has expired"""
+        
+        entry = self.metrics_cache.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        
+        # One in-flight fetch per key; concurrent callers wait and reuse it
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self.metrics_cache.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+            
+            value = await coro_factory()
+            self.metrics_cache[key] = (value, time.monotonic() + ttl)
+            return value
     
     # Placeholder methods for data collection (would integrate with actual data sources)
-    async def _get_price_data(self, protocol: str, days: int) -> pd.DataFrame:
+    async def _get_price_data(self, protocol: str, days: int) -> Optional[pd.DataFrame]:
         """Get historical price data"""
         # Placeholder - would integrate with price feeds
-        return pd.DataFrame()
+        return None
     
-    async def _get_liquidity_data(self, protocol: str) -> Dict[str, Any]:
+    async def _get_liquidity_data(self, protocol: str) -> Optional[Dict[str, Any]]:
         """Get liquidity data"""
         # Placeholder - would integrate with protocol APIs
-        return {}
+        return None
+    
+    async def _get_liquidity_data_batch(self, protocols: List[str]) -> pd.DataFrame:
+        """Get liquidity data for many protocols, one row per protocol"""
+        # Placeholder - would query all protocols in a single provider request
+        rows = await asyncio.gather(*(
+            self._cached(('liquidity', protocol), self.cache_ttl,
+                         lambda protocol=protocol: self._get_liquidity_data(protocol))
+            for protocol in protocols
+        ))
+        return pd.DataFrame.from_records([row or {} for row in rows], index=pd.Index(protocols))
     
-    async def _get_contract_info(self, protocol: str) -> Dict[str, Any]:
+    async def _get_contract_info(self, protocol: str) -> Optional[Dict[str, Any]]:
         """Get smart contract information"""
         # Placeholder - would integrate with contract analysis tools
-        return {}
+        return None
     
-    async def _get_protocol_data(self, protocol: str) -> Dict[str, Any]:
+    async def _get_protocol_data(self, protocol: str) -> Optional[Dict[str, Any]]:
         """Get protocol data"""
         # Placeholder - would integrate with DeFi data providers
-        return {}
+        return None
     
-    async def _get_operational_data(self, protocol: str) -> Dict[str, Any]:
+    async def _get_operational_data(self, protocol: str) -> Optional[Dict[str, Any]]:
         """Get operational data"""
         # Placeholder - would integrate with governance and team data
-        return {}
+        return None
     
     async def start_monitoring(self):
         """Start continuous risk monitoring"""
@@ -589,25 +849,47 @@ class RiskService:
         
         self.monitoring_active = True
         logger.info("Starting risk monitoring...")
+        check_interval = self.risk_config["monitoring"]["check_interval"]
+        next_deadline = time.monotonic()
         
         while self.monitoring_active:
             try:
                 # Monitor all protocols
                 protocols = await self._get_monitored_protocols()
                 
-                for protocol in protocols:
-                    assessment = await self.assess_protocol_risk(protocol)
+                liquidity = {}
+                if len(protocols) > self.liquidity_batch_threshold:
+                    liquidity = await self._assess_liquidity_risk_batch(protocols, datetime.now())
+                
+                assessments = await asyncio.gather(
+                    *(self.assess_protocol_risk(protocol, liquidity.get(protocol)) for protocol in protocols),
+                    return_exceptions=True
+                )
+                
+                for protocol, assessment in zip(protocols, assessments):
+                    # Failures are already logged by assess_protocol_risk
+                    if isinstance(assessment, BaseException):
+                        continue
                     
                     # Check for circuit breaker conditions
                     if assessment.overall_level == RiskLevel.CRITICAL:
                         await self._trigger_circuit_breaker(protocol, assessment)
                 
-                # Wait for next check
-                await asyncio.sleep(self.risk_config["monitoring"]["check_interval"])
+                self._sweep_alerts()
+                
+                # Wait for next check, measured from the previous deadline so
+                # assessment time does not stretch the monitoring period
+                next_deadline += check_interval
+                now = time.monotonic()
+                if next_deadline < now - check_interval:
+                    logger.warning("Risk monitoring fell behind by %.1fs, resetting schedule", now - next_deadline)
+                    next_deadline = now
+                await asyncio.sleep(max(0.0, next_deadline - now))
                 
             except Exception as e:
-                logger.error(f"Error in risk monitoring: {str(e)}")
+                logger.error("Error in risk monitoring: %s", e)
                 await asyncio.sleep(60)
+                next_deadline = time.monotonic()
     
     async def stop_monitoring(self):
         """Stop risk monitoring"""
@@ -622,7 +904,7 @@ class RiskService:
     async def _trigger_circuit_breaker(self, protocol: str, assessment: RiskAssessment):
         """Trigger circuit breaker for critical risk"""
         
-        logger.critical(f"CIRCUIT BREAKER TRIGGERED for {protocol}: {assessment.overall_score:.2f}")
+        logger.critical("CIRCUIT BREAKER TRIGGERED for %s: %.2f", protocol, assessment.overall_score)
         
         # Would integrate with vault contracts to pause operations
         # For now, just log the event
@@ -639,7 +921,26 @@ class RiskService:
             timestamp=datetime.now()
         )
         
+        self._add_alert(alert)
+    
+    def _add_alert(self, alert: RiskAlert):
+        """Store an alert, evicting the oldest ones beyond the cap"""
+        
         self.active_alerts[alert.id] = alert
+        self.active_alerts.move_to_end(alert.id)
+        while len(self.active_alerts) > self.max_active_alerts:
+            self.active_alerts.popitem(last=False)
+    
+    def _sweep_alerts(self):
+        """Drop acknowledged alerts and alerts older than the cooldown"""
+        
+        cutoff = datetime.now() - timedelta(seconds=self.risk_config["monitoring"]["alert_cooldown"])
+        stale = [
+            alert_id for alert_id, alert in self.active_alerts.items()
+            if alert.acknowledged or alert.timestamp < cutoff
+        ]
+        for alert_id in stale:
+            del self.active_alerts[alert_id]
     
     def get_active_alerts(self) -> List[RiskAlert]:
         """Get all active risk alerts"""
@@ -649,40 +950,35 @@ class RiskService:
         """Acknowledge a risk alert"""
         if alert_id in self.active_alerts:
             self.active_alerts[alert_id].acknowledged = True
-            logger.info(f"Alert {alert_id} acknowledged")
+            logger.info("Alert %s acknowledged", alert_id)
     
     def get_risk_history(self, protocol: str = None, days: int = 30) -> List[RiskAssessment]:
         """Get risk assessment history"""
         
         cutoff_date = datetime.now() - timedelta(days=days)
+        source = self._history_by_protocol.get(protocol, ()) if protocol else self.risk_history
         
-        history = [
-            assessment for assessment in self.risk_history
-            if assessment.timestamp >= cutoff_date
-        ]
-        
-        if protocol:
-            history = [a for a in history if a.protocol == protocol]
+        # History is appended in time order, so walk back only until the cutoff
+        history = []
+        for assessment in reversed(source):
+            if assessment.timestamp < cutoff_date:
+                break
+            history.append(assessment)
+        history.reverse()
         
         return history
     
     def get_risk_summary(self) -> Dict[str, Any]:
         """Get risk monitoring summary"""
         
-        active_alerts_by_level = {}
-        for alert in self.active_alerts.values():
-            level = alert.level.value
-            if level not in active_alerts_by_level:
-                active_alerts_by_level[level] = 0
-            active_alerts_by_level[level] += 1
+        active_alerts_by_level = Counter(alert.level.value for alert in self.active_alerts.values())
         
         return {
             'monitoring_active': self.monitoring_active,
             'total_assessments': len(self.risk_history),
             'active_alerts': len(self.active_alerts),
-            'alerts_by_level': active_alerts_by_level,
+            'alerts_by_level': dict(active_alerts_by_level),
             'last_assessment': (
-                max(self.risk_history, key=lambda x: x.timestamp).timestamp.isoformat()
-                if self.risk_history else None
+                self._last_assessment_ts.isoformat() if self._last_assessment_ts else None
             )
         }
@@ -0,0 +1,81 @@
+"""
+Durable task queue for long-running ML jobs.
+Runs data collection and model training in Celery worker processes, outside the API workers.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict
+
+from celery import Celery
+from celery.result import AsyncResult
+
+from .ml_service import MLService
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+celery_app = Celery('yield_farming', broker=REDIS_URL, backend=REDIS_URL)
+celery_app.conf.update(
+    task_track_started=True,
+    task_acks_late=True,  # Re-deliver jobs lost to a worker restart
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,  # Jobs are long; don't hoard them
+    result_expires=86400,  # Keep job status pollable for a day
+    beat_schedule={
+        # API processes pick up the saved models on their next reload check
+        'retrain-models-daily': {
+            'task': 'ml.retrain_models',
+            'schedule': 86400.0
+        }
+    }
+)
+
+def _run_ml_job(method_name: str):
+    """Run an async MLService job to completion inside the worker process"""
+
+    async def run():
+        ml_service = MLService()
+        await ml_service.initialize()
+        try:
+            await getattr(ml_service, method_name)()
+        finally:
+            await ml_service.cleanup()
+
+    asyncio.run(run())
+
+@celery_app.task(name='ml.collect_training_data')
+def collect_training_data():
+    """Collect new training data"""
+    try:
+        _run_ml_job('collect_training_data')
+        logger.info("Data collection completed")
+    except Exception as e:
+        logger.error("Data collection failed: %s", e)
+        raise
+
+@celery_app.task(name='ml.retrain_models')
+def retrain_models():
+    """Retrain ML models with latest data"""
+    try:
+        _run_ml_job('retrain_models')
+        logger.info("Model training completed")
+    except Exception as e:
+        logger.error("Model training failed: %s", e)
+        raise
+
+def get_task_status(task_id: str) -> Dict[str, Any]:
+    """Get the status of a queued job"""
+
+    result = AsyncResult(task_id, app=celery_app)
+    status = {
+        'task_id': task_id,
+        'status': result.status
+    }
+
+    if result.failed():
+        status['error'] = str(result.result)
+
+    return status
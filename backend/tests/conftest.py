@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from backend.api.main import app
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session so the shared client can span tests"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Async test client shared by the whole session"""
+    # ASGITransport does not run the lifespan, so the real Web3/ML services
+    # are never initialized; the tests patch them instead
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
@@ -5,38 +5,144 @@ Tests all major endpoints and functionality.
 
 import pytest
 import asyncio
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch, AsyncMock
-import json
-from datetime import datetime, timedelta
+from unittest.mock import Mock, AsyncMock
+import orjson
+from types import MappingProxyType
+from functools import lru_cache
 
 # Import the FastAPI app
-from backend.api.main import app
-from backend.services.web3_service import Web3Service
-from backend.services.ml_service import MLService
-from backend.services.risk_service import RiskService
+from backend.api.main import app, lifespan
+from backend.api.dependencies import get_ml_service
 
-# Test client
-client = TestClient(app)
+# Fixed timestamp for mock payloads; nothing asserts on freshness
+_FROZEN_TS = "2024-01-01T00:00:00"
+
+# App-level endpoint URLs, resolved once from their route names
+_ROOT_URL = app.url_path_for("root")
+_HEALTH_URL = app.url_path_for("health_check")
+_SYSTEM_INFO_URL = app.url_path_for("system_info")
+
+# Router endpoint URLs for the fixed test identifiers
+_VAULT_ID = "0x123..."
+_USER_ADDRESS = "0x123..."
+_PROTOCOL = "compound"
+_VAULT_URL = f"/api/v1/vaults/{_VAULT_ID}"
+_REBALANCE_URL = f"/api/v1/automation/rebalance/{_VAULT_ID}"
+_PORTFOLIO_URL = f"/api/v1/users/{_USER_ADDRESS}/portfolio"
+_USER_SUMMARY_URL = f"/api/v1/users/{_USER_ADDRESS}/summary"
+_RISK_ASSESS_URL = f"/api/v1/risk/assess/{_PROTOCOL}"
+
+def _aret(value):
+    """Build a coroutine function that returns value, for mocks nobody asserts on"""
+    async def _ret(*args, **kwargs):
+        return value
+    return _ret
+
+# Request bodies serialized once and posted as raw content
+_JSON_H = {"content-type": "application/json"}
+
+_NEW_VAULT = {
+    "name": "New Test Vault",
+    "symbol": "NTV",
+    "asset": "0x456...",
+    "risk_profile": "moderate"
+}
+_NEW_VAULT_BODY = orjson.dumps(_NEW_VAULT)
+
+_PREDICT_BODY = orjson.dumps({
+    "protocols": ["compound", "aave"],
+    "horizon_days": 7
+})
+
+_STRATEGY_BODY = orjson.dumps({
+    "risk_profile": "moderate",
+    "investment_amount": 10000,
+    "protocols": ["compound", "aave", "yearn"]
+})
+
+# Canned service payloads; read-only, copied into plain dicts for the JSON encoder
+_VAULT_INFO = MappingProxyType({
+    'address': '0x123...',
+    'name': 'Test Vault',
+    'symbol': 'TV',
+    'asset': '0x456...',
+    'total_assets': 1000000,
+    'total_supply': 1000000,
+    'apy': 12.5,
+    'risk_profile': 'moderate',
+    'status': 'active'
+})
+
+_PREDICT_PAYLOAD = MappingProxyType({
+    'protocol': 'compound',
+    'predicted_apy': 8.5,
+    'confidence': 0.85,
+    'prediction_horizon': 7,
+    'risk_score': 25.0,
+    'timestamp': _FROZEN_TS
+})
+
+_STRATEGY_PAYLOAD = MappingProxyType({
+    'allocations': {'compound': 0.4, 'aave': 0.3, 'yearn': 0.3},
+    'expected_apy': 9.2,
+    'risk_score': 35.0,
+    'confidence': 0.78,
+    'rebalance_frequency': 24,
+    'timestamp': _FROZEN_TS
+})
+
+_ALERT_PAYLOAD = MappingProxyType({
+    'id': 'alert1',
+    'protocol': 'compound',
+    'level': 'high',
+    'message': 'High utilization detected',
+    'timestamp': _FROZEN_TS
+})
+
+# Payload factories; built on first use and shared, so treat the results as read-only
+@lru_cache(maxsize=None)
+def _vault_list():
+    return (
+        {
+            'id': 'vault1',
+            'name': 'Test Vault 1',
+            'apy': 12.5,
+            'risk_score': 25
+        },
+    )
+
+@lru_cache(maxsize=None)
+def _user_portfolio():
+    return {
+        'total_value': 50000,
+        'total_return': 2500,
+        'allocations': [
+            {'protocol': 'compound', 'value': 20000, 'allocation': 0.4},
+            {'protocol': 'aave', 'value': 15000, 'allocation': 0.3},
+            {'protocol': 'yearn', 'value': 15000, 'allocation': 0.3}
+        ]
+    }
+
+@lru_cache(maxsize=None)
+def _automation_status():
+    return {
+        'active_jobs': 5,
+        'total_executions': 150,
+        'success_rate': 0.98,
+        'providers': {
+            'chainlink': {'jobs': 3, 'status': 'active'},
+            'gelato': {'jobs': 2, 'status': 'active'}
+        }
+    }
 
 # Test fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_web3_service():
     """Mock Web3 service for testing"""
-    service = Mock(spec=Web3Service)
-    service.is_connected = AsyncMock(return_value=True)
-    service.get_vault_info = AsyncMock(return_value={
-        'address': '0x123...',
-        'name': 'Test Vault',
-        'symbol': 'TV',
-        'asset': '0x456...',
-        'total_assets': 1000000,
-        'total_supply': 1000000,
-        'apy': 12.5,
-        'risk_profile': 'moderate',
-        'status': 'active'
-    })
-    service.get_metrics = AsyncMock(return_value={
+    service = Mock()
+    service.is_connected = _aret(True)
+    service.get_vault_info = _aret(dict(_VAULT_INFO))
+    service.get_metrics = _aret({
         'connection_status': True,
         'current_block': 18500000,
         'gas_price': 20000000000,
@@ -44,36 +150,20 @@ def mock_web3_service():
     })
     return service
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ml_service():
     """Mock ML service for testing"""
-    service = Mock(spec=MLService)
-    service.predict_yields = AsyncMock(return_value=[
-        {
-            'protocol': 'compound',
-            'predicted_apy': 8.5,
-            'confidence': 0.85,
-            'prediction_horizon': 7,
-            'risk_score': 25.0,
-            'timestamp': datetime.now().isoformat()
-        }
-    ])
-    service.recommend_strategy = AsyncMock(return_value={
-        'allocations': {'compound': 0.4, 'aave': 0.3, 'yearn': 0.3},
-        'expected_apy': 9.2,
-        'risk_score': 35.0,
-        'confidence': 0.78,
-        'rebalance_frequency': 24,
-        'timestamp': datetime.now().isoformat()
-    })
-    service.get_model_status = AsyncMock(return_value={
+    service = Mock()
+    service.predict_yields = _aret([dict(_PREDICT_PAYLOAD)])
+    service.recommend_strategy = _aret(dict(_STRATEGY_PAYLOAD))
+    service.get_model_status = _aret({
         'yield_predictor': {
             'status': 'active',
             'accuracy': 0.85,
-            'last_trained': datetime.now().isoformat()
+            'last_trained': _FROZEN_TS
         }
     })
-    service.get_metrics = AsyncMock(return_value={
+    service.get_metrics = _aret({
         'models_loaded': 2,
         'cache_hit_rate': 0.75,
         'performance': {
@@ -83,323 +173,304 @@ def mock_ml_service():
     })
     return service
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_risk_service():
     """Mock risk service for testing"""
-    service = Mock(spec=RiskService)
-    service.assess_protocol_risk = AsyncMock(return_value={
+    service = Mock()
+    service.assess_protocol_risk = _aret({
         'protocol': 'compound',
         'overall_score': 25.0,
         'overall_level': 'low',
         'metrics': [],
         'recommendations': ['Monitor liquidity closely'],
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _FROZEN_TS
     })
     return service
 
 class TestHealthEndpoints:
     """Test health and system endpoints"""
     
-    def test_root_endpoint(self):
-        """Test root endpoint"""
-        response = client.get("/")
+    @pytest.fixture
+    def health_services(self, monkeypatch):
+        """Route the health check to mock Web3 and ML services"""
+        web3_service = Mock()
+        web3_service.is_connected = _aret(True)
+        ml_service = Mock()
+        ml_service.get_model_status = _aret({})
+        monkeypatch.setattr('backend.api.main.get_web3_service_dependency', lambda: web3_service)
+        monkeypatch.setattr('backend.api.main.get_ml_service_dependency', lambda: ml_service)
+        monkeypatch.setattr(app.state, 'services_ready', True, raising=False)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("url,expected,keys", [
+        (
+            _ROOT_URL,
+            {"message": "AI-Driven Yield Farming Optimization API", "version": "1.0.0", "status": "operational"},
+            ()
+        ),
+        (
+            _SYSTEM_INFO_URL,
+            {"api_version": "1.0.0"},
+            ("features", "supported_protocols", "supported_tokens")
+        )
+    ], ids=["root", "system_info"])
+    async def test_info_endpoints(self, client, url, expected, keys):
+        """Test root and system info endpoints"""
+        response = await client.get(url)
         assert response.status_code == 200
         data = response.json()
-        assert data["message"] == "AI-Driven Yield Farming Optimization API"
-        assert data["version"] == "1.0.0"
-        assert data["status"] == "operational"
+        for key, value in expected.items():
+            assert data[key] == value
+        for key in keys:
+            assert key in data
     
-    def test_health_check(self):
+    @pytest.mark.asyncio
+    async def test_health_check(self, client, health_services):
         """Test health check endpoint"""
-        with patch('backend.api.main.web3_service') as mock_web3, \
-             patch('backend.api.main.ml_service') as mock_ml:
-            
-            mock_web3.is_connected = AsyncMock(return_value=True)
-            mock_ml.get_model_status = AsyncMock(return_value={})
-            
-            response = client.get("/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert "status" in data
-            assert "services" in data
-    
-    def test_system_info(self):
-        """Test system info endpoint"""
-        response = client.get("/api/v1/system/info")
+        response = await client.get(_HEALTH_URL)
         assert response.status_code == 200
         data = response.json()
-        assert data["api_version"] == "1.0.0"
-        assert "features" in data
-        assert "supported_protocols" in data
-        assert "supported_tokens" in data
+        assert data["status"] == "healthy"
+        assert data["services"]["web3"]["connected"] is True
+        assert data["services"]["ml"]["status"] == "healthy"
 
 class TestVaultEndpoints:
     """Test vault management endpoints"""
     
-    def test_get_vaults(self):
+    @pytest.fixture(autouse=True)
+    def vault_service(self, monkeypatch):
+        """Route the vault router to a fresh mock service"""
+        service = Mock()
+        monkeypatch.setattr('backend.api.routers.vaults.get_vault_service', lambda: service)
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_get_vaults(self, client, vault_service):
         """Test getting all vaults"""
-        with patch('backend.api.routers.vaults.get_vault_service') as mock_service:
-            mock_vault_service = Mock()
-            mock_vault_service.get_all_vaults = AsyncMock(return_value=[
-                {
-                    'id': 'vault1',
-                    'name': 'Test Vault 1',
-                    'apy': 12.5,
-                    'risk_score': 25
-                }
-            ])
-            mock_service.return_value = mock_vault_service
-            
-            response = client.get("/api/v1/vaults")
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data) == 1
-            assert data[0]["name"] == "Test Vault 1"
+        vault_service.get_all_vaults = _aret(list(_vault_list()))
+        
+        response = await client.get("/api/v1/vaults")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Test Vault 1"
     
-    def test_get_vault_by_id(self):
+    @pytest.mark.asyncio
+    async def test_get_vault_by_id(self, client, vault_service):
         """Test getting specific vault"""
-        vault_id = "0x123..."
-        with patch('backend.api.routers.vaults.get_vault_service') as mock_service:
-            mock_vault_service = Mock()
-            mock_vault_service.get_vault = AsyncMock(return_value={
-                'id': vault_id,
-                'name': 'Test Vault',
-                'apy': 12.5,
-                'risk_score': 25,
-                'total_assets': 1000000
-            })
-            mock_service.return_value = mock_vault_service
-            
-            response = client.get(f"/api/v1/vaults/{vault_id}")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["id"] == vault_id
-            assert data["name"] == "Test Vault"
+        vault_service.get_vault = _aret({
+            'id': _VAULT_ID,
+            'name': 'Test Vault',
+            'apy': 12.5,
+            'risk_score': 25,
+            'total_assets': 1000000
+        })
+        
+        response = await client.get(_VAULT_URL)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == _VAULT_ID
+        assert data["name"] == "Test Vault"
     
-    def test_create_vault(self):
+    @pytest.mark.asyncio
+    async def test_create_vault(self, client, vault_service):
         """Test vault creation"""
-        vault_data = {
-            "name": "New Test Vault",
-            "symbol": "NTV",
-            "asset": "0x456...",
-            "risk_profile": "moderate"
-        }
+        vault_service.create_vault = _aret({
+            'id': '0x789...',
+            'transaction_hash': '0xabc...',
+            **_NEW_VAULT
+        })
         
-        with patch('backend.api.routers.vaults.get_vault_service') as mock_service:
-            mock_vault_service = Mock()
-            mock_vault_service.create_vault = AsyncMock(return_value={
-                'id': '0x789...',
-                'transaction_hash': '0xabc...',
-                **vault_data
-            })
-            mock_service.return_value = mock_vault_service
-            
-            response = client.post("/api/v1/vaults", json=vault_data)
-            assert response.status_code == 201
-            data = response.json()
-            assert data["name"] == vault_data["name"]
-            assert "transaction_hash" in data
+        response = await client.post("/api/v1/vaults", content=_NEW_VAULT_BODY, headers=_JSON_H)
+        assert response.status_code == 201
+        data = response.json()
+        assert data["name"] == _NEW_VAULT["name"]
+        assert "transaction_hash" in data
 
 class TestMLEndpoints:
     """Test ML service endpoints"""
     
-    def test_predict_yields(self, mock_ml_service):
+    @pytest.fixture(autouse=True)
+    def ml_service(self, monkeypatch, mock_ml_service):
+        """Override the ML service dependency with the mock ML service"""
+        monkeypatch.setitem(app.dependency_overrides, get_ml_service, lambda: mock_ml_service)
+        return mock_ml_service
+    
+    @pytest.mark.asyncio
+    async def test_predict_yields(self, client):
         """Test yield prediction endpoint"""
-        with patch('backend.api.routers.analytics.get_ml_service') as mock_service:
-            mock_service.return_value = mock_ml_service
-            
-            request_data = {
-                "protocols": ["compound", "aave"],
-                "horizon_days": 7
-            }
-            
-            response = client.post("/api/v1/analytics/predict-yields", json=request_data)
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data) >= 1
-            assert data[0]["protocol"] == "compound"
-            assert "predicted_apy" in data[0]
+        response = await client.post("/api/v1/analytics/predict-yields", content=_PREDICT_BODY, headers=_JSON_H)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) >= 1
+        assert data[0]["protocol"] == "compound"
+        assert "predicted_apy" in data[0]
     
-    def test_strategy_recommendation(self, mock_ml_service):
+    @pytest.mark.asyncio
+    async def test_strategy_recommendation(self, client):
         """Test strategy recommendation endpoint"""
-        with patch('backend.api.routers.analytics.get_ml_service') as mock_service:
-            mock_service.return_value = mock_ml_service
-            
-            request_data = {
-                "risk_profile": "moderate",
-                "investment_amount": 10000,
-                "protocols": ["compound", "aave", "yearn"]
-            }
-            
-            response = client.post("/api/v1/analytics/recommend-strategy", json=request_data)
-            assert response.status_code == 200
-            data = response.json()
-            assert "allocations" in data
-            assert "expected_apy" in data
-            assert "risk_score" in data
+        response = await client.post(
+            "/api/v1/analytics/recommend-strategy", content=_STRATEGY_BODY, headers=_JSON_H
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert "allocations" in data
+        assert "expected_apy" in data
+        assert "risk_score" in data
     
-    def test_model_status(self, mock_ml_service):
+    @pytest.mark.asyncio
+    async def test_model_status(self, client):
         """Test model status endpoint"""
-        with patch('backend.api.routers.analytics.get_ml_service') as mock_service:
-            mock_service.return_value = mock_ml_service
-            
-            response = client.get("/api/v1/analytics/models/status")
-            assert response.status_code == 200
-            data = response.json()
-            assert "yield_predictor" in data
+        response = await client.get("/api/v1/analytics/models/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert "yield_predictor" in data
 
 class TestRiskEndpoints:
     """Test risk management endpoints"""
     
-    def test_assess_risk(self, mock_risk_service):
+    @pytest.fixture(autouse=True)
+    def risk_service(self, monkeypatch, mock_risk_service):
+        """Route the risk router to the mock risk service"""
+        monkeypatch.setattr('backend.api.routers.risk.get_risk_service', lambda: mock_risk_service)
+        return mock_risk_service
+    
+    @pytest.mark.asyncio
+    async def test_assess_risk(self, client):
         """Test risk assessment endpoint"""
-        with patch('backend.api.routers.risk.get_risk_service') as mock_service:
-            mock_service.return_value = mock_risk_service
-            
-            protocol = "compound"
-            response = client.get(f"/api/v1/risk/assess/{protocol}")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["protocol"] == protocol
-            assert "overall_score" in data
-            assert "recommendations" in data
+        response = await client.get(_RISK_ASSESS_URL)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["protocol"] == _PROTOCOL
+        assert "overall_score" in data
+        assert "recommendations" in data
     
-    def test_get_risk_alerts(self):
+    @pytest.mark.asyncio
+    async def test_get_risk_alerts(self, client, risk_service, monkeypatch):
         """Test getting risk alerts"""
-        with patch('backend.api.routers.risk.get_risk_service') as mock_service:
-            mock_risk_service = Mock()
-            mock_risk_service.get_active_alerts = Mock(return_value=[
-                {
-                    'id': 'alert1',
-                    'protocol': 'compound',
-                    'level': 'high',
-                    'message': 'High utilization detected',
-                    'timestamp': datetime.now().isoformat()
-                }
-            ])
-            mock_service.return_value = mock_risk_service
-            
-            response = client.get("/api/v1/risk/alerts")
-            assert response.status_code == 200
-            data = response.json()
-            assert len(data) == 1
-            assert data[0]["protocol"] == "compound"
+        monkeypatch.setattr(risk_service, 'get_active_alerts', Mock(return_value=[dict(_ALERT_PAYLOAD)]))
+        
+        response = await client.get("/api/v1/risk/alerts")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["protocol"] == "compound"
 
 class TestUserEndpoints:
     """Test user-related endpoints"""
     
-    def test_user_portfolio(self):
+    @pytest.fixture(autouse=True)
+    def user_service(self, monkeypatch):
+        """Route the users router to a fresh mock service"""
+        service = Mock()
+        monkeypatch.setattr('backend.api.routers.users.get_user_service', lambda: service)
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_user_portfolio(self, client, user_service):
         """Test getting user portfolio"""
-        user_address = "0x123..."
+        user_service.get_user_portfolio = _aret(_user_portfolio())
         
-        with patch('backend.api.routers.users.get_user_service') as mock_service:
-            mock_user_service = Mock()
-            mock_user_service.get_user_portfolio = AsyncMock(return_value={
-                'total_value': 50000,
-                'total_return': 2500,
-                'allocations': [
-                    {'protocol': 'compound', 'value': 20000, 'allocation': 0.4},
-                    {'protocol': 'aave', 'value': 15000, 'allocation': 0.3},
-                    {'protocol': 'yearn', 'value': 15000, 'allocation': 0.3}
-                ]
-            })
-            mock_service.return_value = mock_user_service
-            
-            response = client.get(f"/api/v1/users/{user_address}/portfolio")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total_value"] == 50000
-            assert len(data["allocations"]) == 3
+        response = await client.get(_PORTFOLIO_URL)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_value"] == 50000
+        assert len(data["allocations"]) == 3
     
-    def test_user_summary(self):
+    @pytest.mark.asyncio
+    async def test_user_summary(self, client, user_service):
         """Test getting user summary"""
-        user_address = "0x123..."
+        user_service.get_user_summary = _aret({
+            'total_value': 50000,
+            'total_return': 5.2,
+            'apy': 12.5,
+            'risk_score': 35,
+            'active_vaults': 3,
+            'pending_transactions': 0
+        })
         
-        with patch('backend.api.routers.users.get_user_service') as mock_service:
-            mock_user_service = Mock()
-            mock_user_service.get_user_summary = AsyncMock(return_value={
-                'total_value': 50000,
-                'total_return': 5.2,
-                'apy': 12.5,
-                'risk_score': 35,
-                'active_vaults': 3,
-                'pending_transactions': 0
-            })
-            mock_service.return_value = mock_service
-            
-            response = client.get(f"/api/v1/users/{user_address}/summary")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["total_value"] == 50000
-            assert data["active_vaults"] == 3
+        response = await client.get(_USER_SUMMARY_URL)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_value"] == 50000
+        assert data["active_vaults"] == 3
 
 class TestAutomationEndpoints:
     """Test automation endpoints"""
     
-    def test_get_automation_status(self):
+    @pytest.fixture(autouse=True)
+    def automation_service(self, monkeypatch):
+        """Route the automation router to a fresh mock service"""
+        service = Mock()
+        monkeypatch.setattr('backend.api.routers.automation.get_automation_service', lambda: service)
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_get_automation_status(self, client, automation_service):
         """Test getting automation status"""
-        with patch('backend.api.routers.automation.get_automation_service') as mock_service:
-            mock_automation_service = Mock()
-            mock_automation_service.get_status = AsyncMock(return_value={
-                'active_jobs': 5,
-                'total_executions': 150,
-                'success_rate': 0.98,
-                'providers': {
-                    'chainlink': {'jobs': 3, 'status': 'active'},
-                    'gelato': {'jobs': 2, 'status': 'active'}
-                }
-            })
-            mock_service.return_value = mock_automation_service
-            
-            response = client.get("/api/v1/automation/status")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["active_jobs"] == 5
-            assert "providers" in data
+        automation_service.get_status = _aret(_automation_status())
+        
+        response = await client.get("/api/v1/automation/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["active_jobs"] == 5
+        assert "providers" in data
     
-    def test_trigger_rebalance(self):
+    @pytest.mark.asyncio
+    async def test_trigger_rebalance(self, client, automation_service):
         """Test triggering manual rebalance"""
-        vault_id = "0x123..."
+        automation_service.trigger_rebalance = _aret({
+            'job_id': 'rebalance_123',
+            'status': 'submitted',
+            'estimated_execution': _FROZEN_TS
+        })
         
-        with patch('backend.api.routers.automation.get_automation_service') as mock_service:
-            mock_automation_service = Mock()
-            mock_automation_service.trigger_rebalance = AsyncMock(return_value={
-                'job_id': 'rebalance_123',
-                'status': 'submitted',
-                'estimated_execution': datetime.now().isoformat()
-            })
-            mock_service.return_value = mock_automation_service
-            
-            response = client.post(f"/api/v1/automation/rebalance/{vault_id}")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "submitted"
-            assert "job_id" in data
+        response = await client.post(_REBALANCE_URL)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "submitted"
+        assert "job_id" in data
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
-    def test_404_endpoint(self):
+    @pytest.mark.asyncio
+    async def test_404_endpoint(self, client):
         """Test non-existent endpoint"""
-        response = client.get("/api/v1/nonexistent")
+        response = await client.get("/api/v1/nonexistent")
         assert response.status_code == 404
     
-    def test_invalid_vault_id(self):
+    @pytest.mark.asyncio
+    async def test_invalid_vault_id(self, client, monkeypatch):
         """Test invalid vault ID"""
-        with patch('backend.api.routers.vaults.get_vault_service') as mock_service:
-            mock_vault_service = Mock()
-            mock_vault_service.get_vault = AsyncMock(side_effect=ValueError("Vault not found"))
-            mock_service.return_value = mock_vault_service
-            
-            response = client.get("/api/v1/vaults/invalid")
-            assert response.status_code == 400
+        vault_service = Mock()
+        vault_service.get_vault = AsyncMock(side_effect=ValueError("Vault not found"))
+        monkeypatch.setattr('backend.api.routers.vaults.get_vault_service', lambda: vault_service)
+        
+        response = await client.get("/api/v1/vaults/invalid")
+        assert response.status_code == 400
     
-    def test_service_unavailable(self):
-        """Test service unavailable scenarios"""
-        with patch('backend.api.main.web3_service', None):
-            response = client.get("/api/v1/vaults")
-            assert response.status_code == 503
+    @pytest.mark.asyncio
+    async def test_startup_failure(self, monkeypatch):
+        """Test that a failed service startup aborts the app and cleans up"""
+        web3_service = Mock()
+        web3_service.initialize = AsyncMock()
+        web3_service.cleanup = AsyncMock()
+        ml_service = Mock()
+        ml_service.initialize = AsyncMock(side_effect=RuntimeError("model load failed"))
+        monkeypatch.setattr('backend.api.main._start_log_listener', Mock)
+        monkeypatch.setattr('backend.api.main.get_web3_service_dependency', lambda: web3_service)
+        monkeypatch.setattr('backend.api.main.get_ml_service_dependency', lambda: ml_service)
+        
+        with pytest.raises(RuntimeError, match="model load failed"):
+            async with lifespan(app):
+                pass
+        
+        web3_service.cleanup.assert_awaited_once()
+        ml_service.cleanup.assert_not_called()
+        assert app.state.services_ready is False
 
+@pytest.mark.skip(reason="not implemented yet")
 class TestWebSocketEndpoints:
     """Test WebSocket endpoints"""
     
@@ -411,6 +482,7 @@ class TestWebSocketEndpoints:
         pass
 
 # Integration tests
+@pytest.mark.skip(reason="not implemented yet")
 class TestIntegration:
     """Integration tests for complete workflows"""
     
@@ -425,6 +497,7 @@ class TestIntegration:
         pass
 
 # Performance tests
+@pytest.mark.skip(reason="not implemented yet")
 class TestPerformance:
     """Performance and load tests"""
     
@@ -0,0 +1,109 @@
+"""
+Tests for the multi-signature proposal service.
+"""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock, AsyncMock
+from eth_abi import encode
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+from backend.services.multisig_service import MultisigService, ProposalStatus, ProposalType
+
+@pytest_asyncio.fixture
+async def multisig_service(monkeypatch):
+    """Multisig service with no contract and no background state loading"""
+    async def skip_initialize_state(self):
+        pass
+    
+    monkeypatch.setattr(MultisigService, '_initialize_state', skip_initialize_state)
+    web3_service = Mock()
+    web3_service.w3 = None
+    return MultisigService(web3_service, "0x" + "00" * 20)
+
+class TestProposalFiltering:
+    """Test proposal filtering by status and type"""
+    
+    @pytest.mark.asyncio
+    async def test_filters_on_zero_valued_enums(self, multisig_service):
+        """PENDING and VAULT_DEPLOYMENT are 0 and must still filter"""
+        deploy_id = await multisig_service.create_proposal(
+            "Deploy vault", "New vault", ProposalType.VAULT_DEPLOYMENT, "0xabc", b"\x01"
+        )
+        update_id = await multisig_service.create_proposal(
+            "Update strategy", "New weights", ProposalType.STRATEGY_UPDATE, "0xabc", b"\x02"
+        )
+        multisig_service._set_status(multisig_service.get_proposal(update_id), ProposalStatus.APPROVED)
+        
+        assert [p.id for p in multisig_service.get_pending_proposals()] == [deploy_id]
+        assert [p.id for p in multisig_service.get_proposals(proposal_type=ProposalType.VAULT_DEPLOYMENT)] == [deploy_id]
+        assert [
+            p.id for p in multisig_service.get_proposals(
+                status=ProposalStatus.PENDING, proposal_type=ProposalType.VAULT_DEPLOYMENT
+            )
+        ] == [deploy_id]
+        assert multisig_service.get_proposals(
+            status=ProposalStatus.PENDING, proposal_type=ProposalType.STRATEGY_UPDATE
+        ) == []
+        assert len(multisig_service.get_proposals()) == 2
+
+class TestExecutionWorker:
+    """Test the queued execution worker"""
+    
+    @pytest.mark.asyncio
+    async def test_survives_cancelled_caller(self, multisig_service, monkeypatch):
+        """A caller cancelled mid-execution must not stop later executions"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def execute(proposal, executor=None):
+            started.set()
+            await release.wait()
+            return "0x" + proposal.id
+        
+        monkeypatch.setattr(multisig_service, '_execute_proposal', execute)
+        multisig_service._execute_queue = asyncio.Queue()
+        worker = asyncio.create_task(multisig_service._execution_worker())
+        
+        proposal_ids = []
+        for data in (b"\x01", b"\x02"):
+            proposal_id = await multisig_service.create_proposal(
+                "Update strategy", "New weights", ProposalType.STRATEGY_UPDATE, "0xabc", data
+            )
+            multisig_service._set_status(multisig_service.get_proposal(proposal_id), ProposalStatus.APPROVED)
+            proposal_ids.append(proposal_id)
+        
+        try:
+            caller = asyncio.create_task(multisig_service.execute_proposal(proposal_ids[0]))
+            await started.wait()
+            caller.cancel()
+            release.set()
+            
+            tx_hash = await asyncio.wait_for(multisig_service.execute_proposal(proposal_ids[1]), 1)
+            assert tx_hash == "0x" + proposal_ids[1]
+            assert not worker.done()
+        finally:
+            worker.cancel()
+
+class TestOnchainState:
+    """Test loading signers and configuration from the contract"""
+    
+    @pytest.mark.asyncio
+    async def test_multicall_owners_are_checksummed(self, multisig_service):
+        """Owners decoded from aggregate3 match the checksummed keys of direct reads"""
+        owner = "0x" + "ab" * 20
+        multisig_service.web3_service.w3 = Mock(codec=Web3().codec)
+        multisig_service.multisig_contract = Mock(address=multisig_service.multisig_address)
+        multicall = Mock()
+        multicall.functions.aggregate3.return_value.call = AsyncMock(return_value=[
+            (True, encode(['address[]'], [[owner]])),
+            (True, encode(['uint256'], [2]))
+        ])
+        multisig_service.async_multicall_contract = multicall
+        
+        owners, required = await multisig_service._read_state_multicall()
+        
+        assert owners == [to_checksum_address(owner)]
+        assert required == 2
@@ -8,9 +8,11 @@ import json
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.contract import Contract
-from web3.middleware import geth_poa_middleware
+from web3.middleware import async_geth_poa_middleware, geth_poa_middleware
+from web3.providers.async_rpc import AsyncHTTPProvider
+from aiohttp import ClientSession
 from eth_account import Account
 from eth_utils import to_checksum_address
 import os
@@ -61,6 +63,8 @@ class Web3Service:
         self.provider_url = provider_url
         self.private_key = private_key
         self.w3 = None
+        self.async_w3 = None  # Non-blocking client for read paths
+        self._async_session = None  # Owned here so cleanup can close it
         self.account = None
         
         # Contract addresses (would be loaded from config)
@@ -94,10 +98,15 @@ class Web3Service:
         try:
             # Initialize Web3
             self.w3 = Web3(Web3.HTTPProvider(self.provider_url))
+            async_provider = AsyncHTTPProvider(self.provider_url)
+            self._async_session = ClientSession(raise_for_status=True)
+            await async_provider.cache_async_session(self._async_session)
+            self.async_w3 = AsyncWeb3(async_provider)
             
             # Add PoA middleware if needed
             if self.w3.eth.chain_id in [137, 80001]:  # Polygon networks
                 self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+                self.async_w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
             
             # Check connection
             if not self.w3.is_connected():
@@ -419,5 +428,8 @@ class Web3Service:
         
         # Cancel event monitoring tasks
         # Close connections
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+        
         # Save transaction history
-        pass
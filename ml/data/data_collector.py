@@ -7,6 +7,7 @@ import asyncio
 import aiohttp
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -101,13 +102,17 @@ class DeFiDataCollector:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        # Pooled keep-alive connections so long-lived collectors reuse sockets
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+        )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+            self.session = None
     
     async def collect_market_data(self, symbols: List[str]) -> List[MarketData]:
         """Collect current market data for given symbols"""
@@ -264,14 +269,11 @@ class DeFiDataCollector:
         
         return min(avg_risk, 100)
     
-    async def collect_historical_data(self, days: int = 30) -> pd.DataFrame:
-        """Collect historical data for analysis"""
+    async def collect_historical_table(self, days: int = 30) -> pa.Table:
+        """Collect historical data for analysis as a columnar Arrow table"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Collect data from all protocols
-        all_data = []
-        
         # Market data
         market_symbols = ['ethereum', 'bitcoin', 'usd-coin', 'tether', 'dai']
         market_data = await self.collect_market_data(market_symbols)
@@ -284,21 +286,22 @@ class DeFiDataCollector:
         # Combine all data
         all_protocol_data = compound_data + aave_data + yearn_data
         
-        # Convert to DataFrame
-        df_data = []
-        for protocol in all_protocol_data:
-            df_data.append({
-                'timestamp': protocol.timestamp,
-                'protocol': protocol.name,
-                'address': protocol.address,
-                'apy': protocol.apy,
-                'tvl': protocol.tvl,
-                'volume_24h': protocol.volume_24h,
-                'risk_score': protocol.risk_score,
-                'liquidity_depth': protocol.liquidity_depth
-            })
-        
-        return pd.DataFrame(df_data)
+        # Build columns directly rather than one dict per row
+        return pa.table({
+            'timestamp': [protocol.timestamp for protocol in all_protocol_data],
+            'protocol': [protocol.name for protocol in all_protocol_data],
+            'address': [protocol.address for protocol in all_protocol_data],
+            'apy': [protocol.apy for protocol in all_protocol_data],
+            'tvl': [protocol.tvl for protocol in all_protocol_data],
+            'volume_24h': [protocol.volume_24h for protocol in all_protocol_data],
+            'risk_score': [protocol.risk_score for protocol in all_protocol_data],
+            'liquidity_depth': [protocol.liquidity_depth for protocol in all_protocol_data]
+        })
+    
+    async def collect_historical_data(self, days: int = 30) -> pd.DataFrame:
+        """Collect historical data for analysis"""
+        table = await self.collect_historical_table(days=days)
+        return table.to_pandas()
     
     async def save_data(self, data: pd.DataFrame, filename: str):
         """Save collected data to file"""
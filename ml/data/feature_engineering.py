@@ -21,6 +21,19 @@ class DeFiFeatureEngineer:
         self.scalers = {}
         self.feature_columns = []
         self.target_columns = []
+        self._transform_fn = None
+        self._scale_cols = []
+        
+    def __getstate__(self):
+        # The inference closure cannot be pickled; it is rebuilt from the fitted scaler
+        state = self.__dict__.copy()
+        state['_transform_fn'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if 'standard' in self.scalers:
+            self._transform_fn = self._build_transform_fn(self._scale_cols)
         
     def create_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create time-based features"""
@@ -246,6 +259,9 @@ class DeFiFeatureEngineer:
     
     def scale_features(self, df: pd.DataFrame, fit: bool = True) -> pd.DataFrame:
         """Scale numerical features"""
+        if not fit and self._transform_fn is not None:
+            return self._transform_fn(df)
+        
         df = df.copy()
         
         # Identify numerical columns to scale
@@ -263,12 +279,25 @@ class DeFiFeatureEngineer:
         if fit:
             self.scalers['standard'] = StandardScaler()
             df[scale_cols] = self.scalers['standard'].fit_transform(df[scale_cols])
+            self._scale_cols = scale_cols
+            self._transform_fn = self._build_transform_fn(scale_cols)
         else:
             if 'standard' in self.scalers:
                 df[scale_cols] = self.scalers['standard'].transform(df[scale_cols])
         
         return df
     
+    def _build_transform_fn(self, scale_cols: List[str]):
+        """Build the inference-time scaling step for the columns seen at fit time"""
+        scaler = self.scalers['standard']
+        
+        def transform(df: pd.DataFrame) -> pd.DataFrame:
+            df = df.copy()
+            df[scale_cols] = scaler.transform(df[scale_cols])
+            return df
+        
+        return transform
+    
     def engineer_features(self, df: pd.DataFrame, fit: bool = True) -> pd.DataFrame:
         """Main feature engineering pipeline"""
         logger.info("Starting feature engineering pipeline...")
@@ -28,6 +28,7 @@ class YieldPredictor:
         self.sequence_length = sequence_length
         self.prediction_horizon = prediction_horizon
         self.model = None
+        self.onnx_session = None
         self.history = None
         self.feature_columns = []
         self.target_columns = []
@@ -66,8 +67,10 @@ class YieldPredictor:
             if len(protocol_data) < self.sequence_length + self.prediction_horizon:
                 continue
             
-            # Extract features and targets
-            features = protocol_data[feature_cols].values
+            # Extract features and targets (contiguous float32 rows for the model)
+            features = np.ascontiguousarray(
+                protocol_data[feature_cols].to_numpy(dtype=np.float32)
+            )
             targets = protocol_data[target_cols].values
             
             # Create sequences
@@ -75,7 +78,7 @@ class YieldPredictor:
                 X_sequences.append(features[i:i + self.sequence_length])
                 y_sequences.append(targets[i + self.sequence_length:i + self.sequence_length + self.prediction_horizon])
         
-        return np.array(X_sequences), np.array(y_sequences)
+        return np.array(X_sequences, dtype=np.float32), np.array(y_sequences)
     
     def build_model(self, input_shape: Tuple, output_shape: Tuple) -> keras.Model:
         """Build LSTM model architecture"""
@@ -227,7 +230,7 @@ class YieldPredictor:
                 protocol: str = None) -> pd.DataFrame:
         """Make predictions using the trained model"""
         
-        if self.model is None:
+        if self.model is None and self.onnx_session is None:
             raise ValueError("Model not trained. Call train() first.")
         
         # Filter by protocol if specified
@@ -241,8 +244,12 @@ class YieldPredictor:
             logger.warning("No sequences could be created for prediction")
             return pd.DataFrame()
         
-        # Make predictions
-        predictions = self.model.predict(X)
+        # Make predictions, preferring the quantized ONNX graph when loaded
+        if self.onnx_session is not None:
+            input_name = self.onnx_session.get_inputs()[0].name
+            predictions = self.onnx_session.run(None, {input_name: X})[0]
+        else:
+            predictions = self.model.predict(X)
         
         # Convert predictions to DataFrame
         results = []
@@ -325,12 +332,54 @@ class YieldPredictor:
         joblib.dump(metadata, metadata_path)
         
         logger.info(f"Model saved to {filepath}")
+        
+        # Drop the previous export first so a failed one can't shadow the new weights
+        for stale_path in (filepath.replace('.h5', '.onnx'), filepath.replace('.h5', '_int8.onnx')):
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
+        
+        try:
+            self.export_onnx(filepath)
+        except ImportError:
+            logger.warning("tf2onnx/onnxruntime not installed, skipping quantized export")
+        except Exception as e:
+            logger.error(f"Quantized export failed, serving the Keras model: {str(e)}")
+    
+    def export_onnx(self, filepath: str):
+        """Export the model to ONNX with int8 dynamic quantization for serving"""
+        import tf2onnx
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        
+        onnx_path = filepath.replace('.h5', '.onnx')
+        quantized_path = filepath.replace('.h5', '_int8.onnx')
+        
+        input_signature = (tf.TensorSpec(
+            (None, self.sequence_length, len(self.feature_columns)), tf.float32, name='input'
+        ),)
+        tf2onnx.convert.from_keras(
+            self.model, input_signature=input_signature, opset=17, output_path=onnx_path
+        )
+        quantize_dynamic(onnx_path, quantized_path, weight_type=QuantType.QInt8)
+        
+        logger.info(f"Quantized model exported to {quantized_path}")
     
     def load_model(self, filepath: str):
         """Load a trained model"""
         
-        # Load model
-        self.model = keras.models.load_model(filepath)
+        # Load model, serving the quantized ONNX export when it is at least as new as the weights
+        quantized_path = filepath.replace('.h5', '_int8.onnx')
+        if (os.path.exists(quantized_path)
+                and os.path.getmtime(quantized_path) >= os.path.getmtime(filepath)):
+            try:
+                import onnxruntime as ort
+                self.onnx_session = ort.InferenceSession(
+                    quantized_path, providers=['CPUExecutionProvider']
+                )
+            except ImportError:
+                logger.warning("onnxruntime not installed, falling back to the Keras model")
+        
+        if self.onnx_session is None:
+            self.model = keras.models.load_model(filepath)
         
         # Load metadata
         metadata_path = filepath.replace('.h5', '_metadata.joblib')